@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+"""
+Inner worker for verify_wiring.py
+
+Runs the GPIO, I2C, and SPI checks plus the summary in one Python
+process so the shell driver pays interpreter startup and module
+imports once instead of once per embedded heredoc.
+"""
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent / "src"))
+
+MOCK_MODE = os.getenv("MOCK_HARDWARE", "false").lower() == "true"
+
+
+def check_dependencies() -> None:
+    """Report availability of the hardware support packages."""
+    try:
+        import RPi.GPIO  # noqa: F401
+
+        print("✅ RPi.GPIO available")
+    except ImportError:
+        print("⚠️  RPi.GPIO not available (using mock mode)")
+
+    try:
+        import smbus2  # noqa: F401
+
+        print("✅ smbus2 available for I2C")
+    except ImportError:
+        print("❌ smbus2 not installed - install with: pip install smbus2")
+
+    try:
+        import spidev  # noqa: F401
+
+        print("✅ spidev available for SPI")
+    except ImportError:
+        print("❌ spidev not installed - install with: pip install spidev")
+
+
+def test_gpio() -> bool:
+    """Exercise pump, input, and LED pins without activating pumps."""
+    from hardware.gpio_manager import GPIOManager
+
+    print("Initializing GPIO manager...")
+    gpio = GPIOManager(mock=MOCK_MODE)
+
+    try:
+        # Test pump pins (outputs) - one batched setup call for all pins
+        pump_pins = [18, 19, 20, 26]
+        print(f"Testing pump control pins: {pump_pins}")
+        gpio.setup_output_pins(pump_pins, initial_state=False)
+
+        for pin in pump_pins:
+            print(f"  Testing pin {pin}...")
+            # Test state changes (but don't actually activate pumps)
+            gpio.set_pin(pin, False)  # Ensure OFF (safe state)
+            print(f"    Pin {pin}: OFF (safe state)")
+
+            if gpio.is_mock_mode():
+                # Only test state changes in mock mode
+                gpio.set_pin(pin, True)
+                gpio.set_pin(pin, False)
+                print(f"    Pin {pin}: State change test passed")
+            else:
+                print(f"    Pin {pin}: Real hardware - keeping in safe state")
+
+        # Test input pins
+        input_pins = [21, 22, 23, 24, 25]  # Overflow sensors + emergency stop
+        print(f"Testing input pins: {input_pins}")
+
+        for pin in input_pins:
+            print(f"  Testing input pin {pin}...")
+            gpio.setup_input_pin(pin, pull_up=True)
+            state = gpio.read_pin(pin)
+            print(f"    Pin {pin}: {'HIGH' if state else 'LOW'}")
+
+        # Test LED pins - batched setup as above
+        led_pins = [5, 6, 12, 13, 16, 17, 27]
+        print(f"Testing LED pins: {led_pins}")
+        gpio.setup_output_pins(led_pins, initial_state=False)
+
+        for pin in led_pins:
+            print(f"  Testing LED pin {pin}...")
+            if gpio.is_mock_mode():
+                # Flash LED in mock mode
+                gpio.set_pin(pin, True)
+                time.sleep(0.1)
+                gpio.set_pin(pin, False)
+                print(f"    LED {pin}: Flash test passed")
+            else:
+                # Just setup, don't flash on real hardware during verification
+                print(f"    LED {pin}: Setup completed")
+
+        print("✅ GPIO test completed successfully")
+        return True
+
+    except Exception as e:
+        print(f"❌ GPIO test failed: {e}")
+        return False
+
+    finally:
+        print("Cleaning up GPIO...")
+        gpio.cleanup()
+
+
+def test_i2c() -> bool:
+    """Probe the I2C bus for the known moisture sensor addresses."""
+    try:
+        if MOCK_MODE:
+            print("✅ I2C test skipped in mock mode")
+            return True
+
+        import smbus2
+        from smbus2 import i2c_msg
+
+        # Test I2C bus 1 (standard for Pi)
+        bus = smbus2.SMBus(1)
+        print("✅ I2C bus 1 accessible")
+
+        # Probe only the known moisture sensor addresses with a quick
+        # write (no data phase) - safer than read_byte, which can hang
+        # misbehaving peripherals, and cheaper than a full bus sweep
+        sensor_addresses = [0x20, 0x21, 0x22, 0x23]
+        found_devices = []
+
+        for addr in sensor_addresses:
+            try:
+                bus.i2c_rdwr(i2c_msg.write(addr, []))
+                found_devices.append(f"0x{addr:02x}")
+            except OSError:
+                pass  # Device not found
+
+        if found_devices:
+            print(f"✅ Found I2C devices at: {', '.join(found_devices)}")
+        else:
+            print("⚠️  No moisture sensors detected (this is OK for initial setup)")
+
+        bus.close()
+        return True
+
+    except ImportError:
+        print("❌ smbus2 not available - I2C functionality will not work")
+        return False
+    except Exception as e:
+        print(f"⚠️  I2C test warning: {e}")
+        return True
+
+
+def test_spi() -> bool:
+    """Open and close the standard MCP3008 SPI device."""
+    try:
+        if MOCK_MODE:
+            print("✅ SPI test skipped in mock mode")
+            return True
+
+        import spidev
+
+        # Test SPI bus 0, device 0 (standard for MCP3008)
+        spi = spidev.SpiDev()
+        spi.open(0, 0)
+        spi.max_speed_hz = 1000000
+        print("✅ SPI bus accessible")
+        spi.close()
+        return True
+
+    except ImportError:
+        print("❌ spidev not available - ADC functionality will not work")
+        return False
+    except Exception as e:
+        print(f"⚠️  SPI test warning: {e}")
+        return True
+
+
+def print_summary() -> None:
+    """Print the verification summary and next steps."""
+    if MOCK_MODE:
+        print("🖥️  Running in MOCK mode (safe for development)")
+        print("   - All GPIO operations are simulated")
+        print("   - No real hardware will be affected")
+        print("   - Set MOCK_HARDWARE=false for real hardware")
+    else:
+        print("🔧 Running in HARDWARE mode")
+        print("   - Real GPIO pins will be controlled")
+        print("   - Ensure all wiring is correct before proceeding")
+        print("   - Emergency stop should be easily accessible")
+
+    print("")
+    print("✅ Hardware verification completed!")
+    print("")
+    print("Next steps:")
+    print("1. Review any warnings above")
+    print("2. Check wiring diagrams in hardware/schematics/")
+    print("3. Test individual components with:")
+    print("   - python scripts/calibration/test_pumps.py")
+    print("   - python scripts/calibration/calibrate_sensors.py")
+    print("4. Run full system test with:")
+    print("   - make test")
+    print("   - python -m src.core.controller")
+    print("")
+    print("⚠️  SAFETY REMINDER:")
+    print("   - Test emergency stop before live operation")
+    print("   - Verify overflow drains are working")
+    print("   - Start with short test cycles")
+    print("   - Monitor system closely during first runs")
+
+
+def main() -> bool:
+    parser = argparse.ArgumentParser(description="OrchidBot wiring verification worker")
+    parser.add_argument(
+        "section",
+        nargs="?",
+        default="all",
+        choices=["deps", "gpio", "i2c", "spi", "summary", "all"],
+        help="Which verification section to run (default: all)",
+    )
+    args = parser.parse_args()
+
+    success = True
+
+    if args.section in ("deps", "all"):
+        print("Checking Python dependencies...")
+        check_dependencies()
+
+    if args.section in ("gpio", "all"):
+        print("")
+        print("Testing GPIO initialization...")
+        success = test_gpio() and success
+
+    if args.section in ("i2c", "all"):
+        print("")
+        print("Testing I2C bus...")
+        test_i2c()
+
+    if args.section in ("spi", "all"):
+        print("")
+        print("Testing SPI bus...")
+        test_spi()
+
+    if args.section in ("summary", "all"):
+        print("")
+        print("System Summary:")
+        print("===============")
+        print_summary()
+
+    return success
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
@@ -4,12 +4,22 @@ Version Check Script
 Extracts version from pyproject.toml for CI workflow
 """
 
+from pathlib import Path
+
+data = Path("pyproject.toml").read_bytes()
+
 try:
-    import tomllib
-    with open("pyproject.toml", "rb") as f:
-        data = tomllib.load(f)
+    import tomllib  # Stdlib C-accelerated parser, Python 3.11+
+
+    version = tomllib.loads(data.decode())["project"]["version"]
 except ImportError:
-    import toml
-    data = toml.load("pyproject.toml")
+    # Pre-3.11: a header-style regex read beats pulling in a pure-Python
+    # TOML parser just to fetch one field
+    import re
+
+    match = re.search(rb'^version\s*=\s*"([^"]+)"', data, re.M)
+    if match is None:
+        raise SystemExit("version field not found in pyproject.toml")
+    version = match.group(1).decode()
 
-print(data["project"]["version"])
\ No newline at end of file
+print(version)
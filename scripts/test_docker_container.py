@@ -4,20 +4,20 @@ Docker Container Test Script
 Tests basic functionality of the OrchidBot controller in Docker container
 """
 
+import importlib
 import sys
-import os
 
-# Add both potential paths for imports
-sys.path.insert(0, "/app")
-sys.path.insert(0, "/app/src")
-sys.path.insert(0, "src")
+# Prepend all candidate locations once; import_module walks them a single time
+sys.path[:0] = ["/app", "/app/src", "src"]
 
 try:
-    from core.controller import HydroponicController
+    HydroponicController = importlib.import_module(
+        "core.controller"
+    ).HydroponicController
     controller = HydroponicController()
     status = controller.get_status()
     assert "running" in status, "Controller status check failed"
     print("✅ Docker container test passed")
 except Exception as e:
     print(f"❌ Docker container test failed: {e}")
-    sys.exit(1)
\ No newline at end of file
+    sys.exit(1)
@@ -0,0 +1,88 @@
+"""
+Circuit Breaker for OrchidBot
+Short-circuits calls into subsystems that keep failing
+"""
+
+import logging
+import time
+from typing import Any, Awaitable, Callable
+
+logger = logging.getLogger(__name__)
+
+
+class CircuitOpenError(Exception):
+    """Raised when a call is refused because the circuit is open."""
+
+
+class CircuitBreaker:
+    """
+    Minimal in-process circuit breaker.
+
+    Consecutive failures are counted; once failure_threshold is
+    reached the circuit opens and execute() raises CircuitOpenError
+    immediately instead of re-hitting the broken subsystem. After
+    recovery_timeout seconds one probe call is let through
+    (half-open); success closes the circuit again.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 3,
+        recovery_timeout: float = 30.0,
+    ) -> None:
+        """
+        Initialize circuit breaker.
+
+        Args:
+            failure_threshold: Consecutive failures before opening
+            recovery_timeout: Seconds before a probe call is allowed
+        """
+        self.failure_threshold = failure_threshold
+        # Integer nanoseconds on the monotonic clock; immune to
+        # wall-clock jumps while the circuit is open
+        self._recovery_ns = int(recovery_timeout * 1_000_000_000)
+        self._failures = 0
+        self._opened_at_ns = 0
+        self.state = "CLOSED"
+
+    async def execute(self, func: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Run an async callable under the breaker.
+
+        Args:
+            func: Zero-argument coroutine function to call
+
+        Returns:
+            The callable's result
+
+        Raises:
+            CircuitOpenError: If the circuit is open and the recovery
+                timeout has not elapsed
+        """
+        if self.state == "OPEN":
+            if time.monotonic_ns() - self._opened_at_ns < self._recovery_ns:
+                raise CircuitOpenError(
+                    f"Circuit open after {self._failures} consecutive failures"
+                )
+            # Recovery window elapsed; let one probe call through
+            self.state = "HALF_OPEN"
+            logger.info("Circuit breaker half-open, probing subsystem")
+
+        try:
+            result = await func()
+        except Exception:
+            self._failures += 1
+            if self._failures >= self.failure_threshold:
+                self.state = "OPEN"
+                self._opened_at_ns = time.monotonic_ns()
+                logger.warning(
+                    "Circuit breaker opened after %s consecutive failures",
+                    self._failures,
+                )
+            raise
+
+        if self._failures:
+            logger.info("Circuit breaker closed, subsystem recovered")
+        self._failures = 0
+        self.state = "CLOSED"
+        return result
@@ -4,18 +4,35 @@ Coordinates all system components with safety-first design
 """
 
 import asyncio
+import atexit
+import copy
+import functools
 import logging
+import logging.handlers
 import os
+import queue
 import signal
 import sys
 import threading
 import time
 from datetime import datetime
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
 import yaml
 from dotenv import load_dotenv
 
+try:
+    # LibYAML C bindings parse far faster than the pure-Python loader
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
+
+try:
+    import numpy as np
+except ImportError:
+    # numpy ships with the RPi requirements; fall back to dict scans
+    np = None  # type: ignore[assignment]
+
 try:
     from ..hardware.gpio_manager import GPIOManager
     from ..sensors.moisture import MoistureSensorManager
@@ -35,20 +52,56 @@ load_dotenv()
 # Configure logging safely
 log_file = os.getenv("LOG_FILE", "data/logs/orchidbot.log")
 log_dir = os.path.dirname(log_file)
-if log_dir and not os.path.exists(log_dir):
+if log_dir:
+    # exist_ok already handles the common case; skipping the exists()
+    # pre-check saves a stat syscall on every startup
     os.makedirs(log_dir, exist_ok=True)
 
+# Route records through a queue so emitters never block on disk or
+# terminal writes; a background listener owns the real handlers
+_log_queue: "queue.SimpleQueue" = queue.SimpleQueue()
 logging.basicConfig(
     level=getattr(logging, os.getenv("LOG_LEVEL", "INFO")),
     format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    handlers=[
-        logging.FileHandler(log_file),
-        logging.StreamHandler(),
-    ],
+    handlers=[logging.handlers.QueueHandler(_log_queue)],
+)
+_log_listener = logging.handlers.QueueListener(
+    _log_queue,
+    logging.FileHandler(log_file),
+    logging.StreamHandler(),
+    respect_handler_level=True,
 )
+_log_listener.start()
+atexit.register(_log_listener.stop)
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=1)
+def _load_default_config() -> Dict[str, Any]:
+    """Build the default configuration once per process."""
+    return {
+        "pumps": {
+            "pins": [18, 19, 20, 26],
+            "timeout": 10.0,
+            "max_daily_runtime": 1800,
+        },
+        "sensors": {
+            "moisture_threshold": 40.0,
+            "target_moisture": 55.0,
+            "reading_interval": 5.0,
+        },
+        "watering": {
+            "flood_duration": 300,
+            "drain_duration": 600,
+            "interval": 86400,
+        },
+        "safety": {
+            "watchdog_timeout": 30,
+            "emergency_pin": 25,
+        },
+    }
+
+
 class HydroponicController:
     """
     Main controller for the OrchidBot hydroponic system.
@@ -57,15 +110,23 @@ class HydroponicController:
     with fail-safe mechanisms for plant protection.
     """
 
-    def __init__(self, config_path: str = "config/local.yaml"):
+    def __init__(
+        self,
+        config_path: str = "config/local.yaml",
+        config: Optional[Dict[str, Any]] = None,
+    ):
         """
         Initialize the hydroponic controller.
 
         Args:
             config_path: Path to configuration file
+            config: Pre-parsed configuration dict; skips file loading
+                entirely when given (tests, embedding callers)
         """
         self.config_path = config_path
-        self.config = self._load_config()
+        loaded = config if config is not None else self._load_config()
+        self.config = self._merge_with_defaults(loaded)
+        self._bind_config()
         self.running = False
         self.emergency_stop = False
 
@@ -73,23 +134,46 @@ class HydroponicController:
         self.gpio_manager = GPIOManager(
             mock=os.getenv("MOCK_HARDWARE", "true").lower() == "true"
         )
-        self.safety_manager = SafetyManager(self.gpio_manager)
+        self.safety_manager = SafetyManager(
+            self.gpio_manager, pump_pins=self._pump_pins
+        )
         self.moisture_sensors = MoistureSensorManager()
         self.overflow_sensors = OverflowSensorManager(self.gpio_manager)
 
         # System state
         self.pump_states: Dict[int, bool] = {}
-        self.last_sensor_readings: Dict[str, float] = {}
+        self._pump_deadlines: Dict[int, asyncio.TimerHandle] = {}
+        # Readings are pre-partitioned at insertion so the watering
+        # decision never has to prefix-test sensor ids on the hot path;
+        # last_sensor_readings presents the merged view on demand
+        self._moisture_readings: Dict[str, float] = {}
+        self._overflow_readings: Dict[str, float] = {}
+        # Structure-of-arrays view of the moisture readings so the
+        # watering decision is one vectorized compare (numpy only)
+        self._moisture_ids: list = []
+        self._moisture_values: Any = None
+        self._next_sensor_log = 0.0  # Monotonic deadline for periodic logging
+        # Wake event lets sensor alerts cut the poll latency short
+        self._wake_event = asyncio.Event()
+        # Shutdown is requested by setting an event from the signal
+        # handler; the loop reference is captured in start() so the set
+        # can be marshalled onto the loop thread safely
+        self._shutdown_event: Optional[asyncio.Event] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        start_time = datetime.now()
+        self._start_ts = start_time.timestamp()  # Float for cheap uptime math
         self.system_stats = {
-            "start_time": datetime.now(),
+            "start_time": start_time,
             "total_runtime": 0,
             "cycle_count": 0,
             "last_watering": None,
         }
 
-        # Setup signal handlers for graceful shutdown
-        signal.signal(signal.SIGTERM, self._signal_handler)
-        signal.signal(signal.SIGINT, self._signal_handler)
+        # Setup signal handlers for graceful shutdown (only possible on
+        # the main thread; worker-thread construction skips them)
+        if threading.current_thread() is threading.main_thread():
+            signal.signal(signal.SIGTERM, self._signal_handler)
+            signal.signal(signal.SIGINT, self._signal_handler)
 
         logger.info("HydroponicController initialized")
 
@@ -97,7 +181,7 @@ class HydroponicController:
         """Load configuration from YAML file."""
         try:
             with open(self.config_path, "r") as f:
-                config = yaml.safe_load(f)
+                config = yaml.load(f, Loader=_YamlLoader)  # nosec B506
             logger.info(f"Configuration loaded from {self.config_path}")
             return config or {}  # Ensure we return a dict, not None
         except FileNotFoundError:
@@ -107,29 +191,41 @@ class HydroponicController:
             logger.error(f"Error parsing config file: {e}")
             return self._get_default_config()
 
+    def _merge_with_defaults(self, config: Dict[str, Any]) -> Dict[str, Any]:
+        """Overlay a possibly partial config onto the defaults.
+
+        _load_config tolerates partial or empty files, but _bind_config
+        indexes every section unconditionally; merging section by
+        section fills the gaps with default values instead of raising
+        KeyError at construction.
+        """
+        merged = self._get_default_config()
+        for section, values in config.items():
+            if isinstance(values, dict) and isinstance(merged.get(section), dict):
+                merged[section].update(values)
+            else:
+                merged[section] = values
+        return merged
+
+    def _bind_config(self) -> None:
+        """Hoist config values used by the control loop into attributes.
+
+        The 1 Hz main loop and the flood/drain phases would otherwise
+        re-hash two dict keys per lookup on every tick.
+        """
+        self._pump_pins: tuple = tuple(self.config["pumps"]["pins"])
+        self._emergency_pin: int = self.config["safety"]["emergency_pin"]
+        self._moisture_threshold: float = self.config["sensors"]["moisture_threshold"]
+        self._flood_duration: float = self.config["watering"]["flood_duration"]
+        self._drain_duration: float = self.config["watering"]["drain_duration"]
+
     def _get_default_config(self) -> Dict[str, Any]:
-        """Return default configuration."""
-        return {
-            "pumps": {
-                "pins": [18, 19, 20, 26],
-                "timeout": 10.0,
-                "max_daily_runtime": 1800,
-            },
-            "sensors": {
-                "moisture_threshold": 40.0,
-                "target_moisture": 55.0,
-                "reading_interval": 5.0,
-            },
-            "watering": {
-                "flood_duration": 300,
-                "drain_duration": 600,
-                "interval": 86400,
-            },
-            "safety": {
-                "watchdog_timeout": 30,
-                "emergency_pin": 25,
-            },
-        }
+        """Return default configuration.
+
+        The cached template is deep-copied so per-instance mutation
+        (tests, API callers) never leaks into the shared defaults.
+        """
+        return copy.deepcopy(_load_default_config())
 
     async def start(self) -> None:
         """Start the hydroponic controller main loop."""
@@ -139,6 +235,8 @@ class HydroponicController:
 
         logger.info("Starting OrchidBot Hydroponic Controller")
         self.running = True
+        self._loop = asyncio.get_running_loop()
+        self._shutdown_event = asyncio.Event()
 
         try:
             # Initialize hardware
@@ -161,34 +259,42 @@ class HydroponicController:
         logger.info("Initializing hardware components")
 
         # Setup GPIO pins
-        pump_pins = self.config["pumps"]["pins"]
-        for pin in pump_pins:
+        for pin in self._pump_pins:
             self.gpio_manager.setup_output_pin(pin, initial_state=False)
             self.pump_states[pin] = False
 
         # Setup emergency stop pin
-        emergency_pin = self.config["safety"]["emergency_pin"]
-        self.gpio_manager.setup_input_pin(emergency_pin, pull_up=True)
+        self.gpio_manager.setup_input_pin(self._emergency_pin, pull_up=True)
 
         # Initialize sensors
         await self.moisture_sensors.initialize()
         await self.overflow_sensors.initialize()
 
+        # Overflow alerts wake the main loop immediately instead of
+        # waiting out the remainder of the poll interval
+        self.overflow_sensors.add_alert_callback(self._on_sensor_alert)
+
         logger.info("Hardware initialization complete")
 
     async def _main_loop(self) -> None:
         """Main control loop with sensor monitoring and pump control."""
         logger.info("Starting main control loop")
 
+        shutdown_requested = self._shutdown_event
         while self.running and not self.emergency_stop:
+            if shutdown_requested is not None and shutdown_requested.is_set():
+                logger.info("Shutdown requested, leaving main loop")
+                break
             try:
+                now = time.monotonic()
+
                 # Check emergency stop
                 if self._check_emergency_stop():
                     await self.emergency_shutdown()
                     break
 
                 # Read sensors
-                await self._read_sensors()
+                await self._read_sensors(now)
 
                 # Check watering needs
                 if await self._should_water():
@@ -199,31 +305,104 @@ class HydroponicController:
                     logger.warning("Safety check failed, stopping pumps")
                     await self._stop_all_pumps()
 
-                # Brief pause
-                await asyncio.sleep(1.0)
+                # Wait out the tick, but wake early on sensor alerts.
+                # The 1 s budget is kept as the upper bound because the
+                # emergency-stop pin is polled by this loop; only the
+                # alert-driven wakeups are event-driven.
+                self._wake_event.clear()
+                try:
+                    await asyncio.wait_for(self._wake_event.wait(), timeout=1.0)
+                except asyncio.TimeoutError:
+                    pass
 
             except Exception as e:
                 logger.error(f"Error in main loop: {e}")
                 await asyncio.sleep(5.0)
 
-    async def _read_sensors(self) -> None:
-        """Read all sensor values with caching."""
-        try:
-            # Read moisture sensors
-            moisture_readings = await self.moisture_sensors.read_all()
-            self.last_sensor_readings.update(moisture_readings)
+    async def _read_sensors(self, now: Optional[float] = None) -> None:
+        """Read all sensor values with caching.
 
-            # Read overflow sensors
-            overflow_status = await self.overflow_sensors.read_all()
-            self.last_sensor_readings.update(overflow_status)
+        Args:
+            now: Monotonic timestamp from the caller's tick, read once
+                per loop iteration; taken fresh when omitted.
+        """
+        if now is None:
+            now = time.monotonic()
 
-            # Log readings periodically
-            if int(time.time()) % 60 == 0:  # Every minute
-                logger.info(f"Sensor readings: {self.last_sensor_readings}")
+        try:
+            # Submit both sensor batches together so the I2C and GPIO
+            # transactions overlap instead of running back-to-back
+            moisture_readings, overflow_status = await asyncio.gather(
+                self.moisture_sensors.read_all(),
+                self.overflow_sensors.read_all(),
+            )
+            self._moisture_readings.update(moisture_readings)
+            # Mirror the merged dict, not the per-tick delta: on a
+            # partial read failure the delta is missing the failed
+            # sensor, and a buffer built from it would silently drop
+            # that sensor's last known (possibly below-threshold) value
+            self._update_moisture_buffer(self._moisture_readings)
+            self._overflow_readings.update(overflow_status)
+
+            # Log readings periodically; a deadline compare replaces the
+            # racy wall-clock modulo sampling
+            if now >= self._next_sensor_log:
+                if logger.isEnabledFor(logging.INFO):
+                    # Lazy %s formatting defers the dict repr until a
+                    # handler actually accepts the record
+                    logger.info("Sensor readings: %s", self.last_sensor_readings)
+                self._next_sensor_log = now + 60.0
 
         except Exception as e:
             logger.error(f"Error reading sensors: {e}")
 
+    @property
+    def last_sensor_readings(self) -> Dict[str, float]:
+        """Merged view of all sensor readings, built only on demand."""
+        return {**self._moisture_readings, **self._overflow_readings}
+
+    @last_sensor_readings.setter
+    def last_sensor_readings(self, readings: Dict[str, float]) -> None:
+        # Partition once at assignment (tests, API callers) so reads
+        # stay prefix-test free
+        self._moisture_readings = {
+            sensor_id: value
+            for sensor_id, value in readings.items()
+            if sensor_id.startswith("moisture_")
+        }
+        self._overflow_readings = {
+            sensor_id: value
+            for sensor_id, value in readings.items()
+            if not sensor_id.startswith("moisture_")
+        }
+        self._update_moisture_buffer(self._moisture_readings)
+
+    def _on_sensor_alert(self, event: str) -> None:
+        """Wake the main loop early when a sensor raises an alert."""
+        logger.debug(f"Sensor alert received: {event}")
+        self._wake_event.set()
+
+    def _update_moisture_buffer(self, readings: Dict[str, float]) -> None:
+        """Mirror moisture readings into the preallocated value array."""
+        if np is None:
+            return
+
+        if not readings:
+            # An emptied partition must empty the mirror too, or the
+            # vectorized _should_water() path keeps deciding from
+            # readings that no longer exist
+            self._moisture_ids = []
+            self._moisture_values = None
+            return
+
+        ids = sorted(readings)
+        if ids != self._moisture_ids:
+            self._moisture_ids = ids
+            self._moisture_values = np.empty(len(ids), dtype=np.float32)
+
+        for index, sensor_id in enumerate(ids):
+            self._moisture_values[index] = readings[sensor_id]
+
     async def _should_water(self) -> bool:
         """
         Determine if watering is needed based on sensor readings.
@@ -232,10 +411,24 @@ class HydroponicController:
             bool: True if watering cycle should start
         """
         # Check if any moisture sensor is below threshold
-        moisture_threshold = self.config["sensors"]["moisture_threshold"]
+        moisture_threshold = self._moisture_threshold
+
+        if self._moisture_values is not None:
+            # Single vectorized compare over all sensors
+            below = self._moisture_values < moisture_threshold
+            if bool(below.any()):
+                index = int(self._moisture_values.argmin())
+                logger.info(
+                    f"Watering needed: {self._moisture_ids[index]} = "
+                    f"{self._moisture_values[index]}% < {moisture_threshold}%"
+                )
+                return True
+            return False
 
-        for sensor_id, reading in self.last_sensor_readings.items():
-            if sensor_id.startswith("moisture_") and reading < moisture_threshold:
+        # Fallback path when numpy is unavailable; the readings are
+        # already partitioned, so no prefix test is needed
+        for sensor_id, reading in self._moisture_readings.items():
+            if reading < moisture_threshold:
                 logger.info(
                     f"Watering needed: {sensor_id} = {reading}% < {moisture_threshold}%"
                 )
@@ -275,17 +468,18 @@ class HydroponicController:
 
     async def _flood_phase(self) -> None:
         """Execute flooding phase of watering cycle."""
-        flood_duration = self.config["watering"]["flood_duration"]
+        flood_duration = self._flood_duration
         logger.info(f"Starting flood phase for {flood_duration} seconds")
 
         # Start pumps with timeout safety
-        for pin in self.config["pumps"]["pins"]:
+        for pin in self._pump_pins:
             if await self._start_pump(pin, timeout=flood_duration):
                 self.pump_states[pin] = True
 
-        # Monitor for flood duration
-        start_time = time.time()
-        while time.time() - start_time < flood_duration:
+        # Monitor for flood duration; integer deadline on the monotonic
+        # clock is immune to wall-clock jumps mid-cycle
+        deadline_ns = time.monotonic_ns() + int(flood_duration * 1_000_000_000)
+        while time.monotonic_ns() < deadline_ns:
             # Check for overflow
             if await self.overflow_sensors.check_overflow():
                 logger.warning("Overflow detected, stopping flood phase")
@@ -303,7 +497,7 @@ class HydroponicController:
 
     async def _drain_phase(self) -> None:
         """Execute draining phase of watering cycle."""
-        drain_duration = self.config["watering"]["drain_duration"]
+        drain_duration = self._drain_duration
         logger.info(f"Starting drain phase for {drain_duration} seconds")
 
         # Wait for drainage (pumps off)
@@ -331,8 +525,11 @@ class HydroponicController:
             # Start pump (active low for relays)
             self.gpio_manager.set_pin(pin, True)
 
-            # Set timeout timer
-            threading.Timer(timeout, lambda: self._force_stop_pump(pin)).start()
+            # Schedule the timeout on the event loop instead of spawning
+            # a thread per pump; the handle makes cancellation O(1)
+            self._pump_deadlines[pin] = asyncio.get_running_loop().call_later(
+                timeout, self._force_stop_pump, pin
+            )
 
             logger.info(f"Pump started on pin {pin} with {timeout}s timeout")
             return True
@@ -344,6 +541,7 @@ class HydroponicController:
     def _force_stop_pump(self, pin: int) -> None:
         """Force stop a pump (timeout safety mechanism)."""
         logger.warning(f"Force stopping pump on pin {pin} due to timeout")
+        self._pump_deadlines.pop(pin, None)
         self.gpio_manager.set_pin(pin, False)
         self.pump_states[pin] = False
 
@@ -351,14 +549,20 @@ class HydroponicController:
         """Stop all pumps immediately."""
         logger.info("Stopping all pumps")
 
-        for pin in self.config["pumps"]["pins"]:
-            self.gpio_manager.set_pin(pin, False)
-            self.pump_states[pin] = False
+        for pin in self._pump_pins:
+            deadline = self._pump_deadlines.pop(pin, None)
+            if deadline is not None:
+                deadline.cancel()
+
+        # One coalesced write drops every pump in the same transaction
+        self.gpio_manager.set_pins_bulk(list(self._pump_pins), False)
+        self.pump_states.update({pin: False for pin in self._pump_pins})
 
     def _check_emergency_stop(self) -> bool:
         """Check if emergency stop is activated."""
-        emergency_pin = self.config["safety"]["emergency_pin"]
-        emergency_active = not self.gpio_manager.read_pin(emergency_pin)  # Active low
+        emergency_active = not self.gpio_manager.read_pin(
+            self._emergency_pin
+        )  # Active low
 
         if emergency_active and not self.emergency_stop:
             logger.critical("EMERGENCY STOP ACTIVATED")
@@ -401,7 +605,15 @@ class HydroponicController:
     def _signal_handler(self, signum: int, frame: Any) -> None:
         """Handle shutdown signals."""
         logger.info(f"Received signal {signum}, initiating shutdown")
-        asyncio.create_task(self.stop())
+        if self._loop is not None and self._shutdown_event is not None:
+            # Marshal onto the loop thread; creating a task directly
+            # from signal context can race with loop teardown. The wake
+            # event is set too so an idle poll wait returns immediately,
+            # and stop() runs in start()'s finally once the loop exits.
+            self._loop.call_soon_threadsafe(self._shutdown_event.set)
+            self._loop.call_soon_threadsafe(self._wake_event.set)
+        else:
+            self.running = False
 
     def get_status(self) -> Dict[str, Any]:
         """Get current system status."""
@@ -411,14 +623,9 @@ class HydroponicController:
             "pump_states": self.pump_states,
             "sensor_readings": self.last_sensor_readings,
             "system_stats": self.system_stats,
-            "uptime": (
-                datetime.now()
-                - (
-                    self.system_stats["start_time"]
-                    if isinstance(self.system_stats["start_time"], datetime)
-                    else datetime.now()
-                )
-            ).total_seconds(),
+            # Float subtraction against the cached start timestamp avoids
+            # building datetime/timedelta objects on every poll
+            "uptime": time.time() - self._start_ts,
         }
 
 
@@ -437,4 +644,12 @@ async def main() -> None:
 
 
 if __name__ == "__main__":
+    try:
+        # libuv-backed event loop cuts per-tick scheduler overhead
+        import uvloop
+
+        uvloop.install()
+    except ImportError:
+        pass
+
     asyncio.run(main())
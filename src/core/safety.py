@@ -3,17 +3,47 @@ Safety Manager for OrchidBot
 Critical safety mechanisms to protect plants and equipment
 """
 
+import asyncio
 import logging
 import threading
 import time
-from typing import Dict, List, Optional, TYPE_CHECKING
+from array import array
+from enum import IntFlag
+from typing import Dict, Iterable, List, Optional, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from ..hardware.gpio_manager import GPIOManager
 
+try:
+    import psutil as _psutil
+
+    # Prime the CPU counter so later interval=None calls return deltas
+    _psutil.cpu_percent(interval=None)
+except ImportError:
+    _psutil = None  # type: ignore[assignment]
+
 logger = logging.getLogger(__name__)
 
 
+class _Violation(IntFlag):
+    """Bit flags for safety conditions; masks compare as single ints."""
+
+    EMERGENCY_STOP = 1
+    RESOURCES = 2
+    HARDWARE = 4
+
+
+# Sentinel deadline meaning "pump not running"; larger than any real
+# monotonic-ns value so the expiry compare never fires for idle slots
+_NO_DEADLINE = (1 << 63) - 1
+
+_VIOLATION_MESSAGES = {
+    _Violation.EMERGENCY_STOP: "Emergency stop activated",
+    _Violation.RESOURCES: "System resource limits exceeded",
+    _Violation.HARDWARE: "Hardware connection issues detected",
+}
+
+
 class SafetyManager:
     """
     Comprehensive safety management system for OrchidBot.
@@ -26,57 +56,91 @@ class SafetyManager:
     - System health monitoring
     """
 
-    def __init__(self, gpio_manager: "GPIOManager") -> None:
+    def __init__(
+        self,
+        gpio_manager: "GPIOManager",
+        pump_pins: Optional[Iterable[int]] = None,
+    ) -> None:
         """
         Initialize safety manager.
 
         Args:
             gpio_manager: GPIO manager instance for hardware control
+            pump_pins: Known pump pins; pre-sizes the deadline slots so
+                the hot-path check never grows the array. Pins not
+                listed here still get a slot lazily on first start.
         """
         self.gpio_manager = gpio_manager
         self.monitoring = False
-        self.monitor_thread: Optional[threading.Thread] = None
-
-        # Safety state tracking
+        self._monitor_task: Optional["asyncio.Task"] = None
+        # Thread id of the event loop once monitoring starts; all mutable
+        # safety state below is asyncio-thread-only, so no locks are
+        # needed (and none would be safe to add on free-threaded builds
+        # without a full lock hierarchy)
+        self._loop_tid: Optional[int] = None
+
+        # Safety state tracking; deadlines are monotonic-ns integers so
+        # timeout checks are single int compares immune to clock skew
         self.emergency_stop_active = False
-        self.pump_timeouts: Dict[int, float] = {}
-        self.last_watchdog_reset = time.time()
-        self.safety_violations: List[str] = []
+        # Deadlines live in a fixed slot-indexed int64 array (one slot
+        # per pump pin), so the periodic expiry check is a contiguous
+        # scan of a handful of ints instead of dict probing
+        self._pin_to_slot: Dict[int, int] = {}
+        self._deadlines = array("q")
+        for pin in pump_pins or ():
+            self._pin_to_slot[pin] = len(self._deadlines)
+            self._deadlines.append(_NO_DEADLINE)
+        self.last_watchdog_reset = time.monotonic_ns()
+        # Active violations as a bitmask; the string list is decoded
+        # lazily by the safety_violations property when status is queried
+        self._violation_mask = _Violation(0)
 
         # Configuration
         self.watchdog_timeout = 30.0  # seconds
         self.max_pump_runtime = 600.0  # 10 minutes max
         self.safety_check_interval = 1.0  # seconds
+        self._watchdog_timeout_ns = int(self.watchdog_timeout * 1_000_000_000)
+        self._resource_check_ticks = 10  # Sample CPU/memory every Nth check
+        self._tick_count = 0
+        self._resources_ok = True
 
         logger.info("SafetyManager initialized")
 
     def start_monitoring(self) -> None:
-        """Start safety monitoring thread."""
+        """Start the safety monitoring task on the running event loop."""
         if self.monitoring:
             logger.warning("Safety monitoring already running")
             return
 
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            logger.warning("No running event loop, safety monitoring not started")
+            return
+
         self.monitoring = True
-        self.monitor_thread = threading.Thread(
-            target=self._monitor_loop, name="SafetyMonitor", daemon=True
-        )
-        self.monitor_thread.start()
+        self._loop_tid = threading.get_ident()
+        self._monitor_task = loop.create_task(self._monitor_loop())
         logger.info("Safety monitoring started")
 
     def stop_monitoring(self) -> None:
         """Stop safety monitoring."""
         self.monitoring = False
-        if self.monitor_thread and self.monitor_thread.is_alive():
-            self.monitor_thread.join(timeout=5.0)
+        if self._monitor_task is not None and not self._monitor_task.done():
+            self._monitor_task.cancel()
+        self._monitor_task = None
         logger.info("Safety monitoring stopped")
 
-    def _monitor_loop(self) -> None:
-        """Main safety monitoring loop."""
+    async def _monitor_loop(self) -> None:
+        """Periodic safety checks run as an asyncio task.
+
+        The controller's main loop already calls
+        check_all_safety_conditions every tick, so this task only covers
+        the watchdog and pump timeout deadlines. Running on the event
+        loop instead of a thread removes all cross-thread state sharing.
+        """
         while self.monitoring:
             try:
-                # Check all safety conditions
-                self.check_all_safety_conditions()
-
                 # Check watchdog timeout
                 self._check_watchdog_timeout()
 
@@ -84,11 +148,13 @@ class SafetyManager:
                 self._check_pump_timeouts()
 
                 # Brief pause
-                time.sleep(self.safety_check_interval)
+                await asyncio.sleep(self.safety_check_interval)
 
+            except asyncio.CancelledError:
+                raise
             except Exception as e:
                 logger.error(f"Error in safety monitor: {e}")
-                time.sleep(5.0)
+                await asyncio.sleep(5.0)
 
     def check_all_safety_conditions(self) -> bool:
         """
@@ -97,33 +163,56 @@ class SafetyManager:
         Returns:
             bool: True if all conditions are safe
         """
-        safe = True
-        current_violations = []
+        mask = _Violation(0)
 
         # Check emergency stop
         if self._check_emergency_stop():
-            current_violations.append("Emergency stop activated")
-            safe = False
+            mask |= _Violation.EMERGENCY_STOP
 
         # Check system resources
         if not self._check_system_resources():
-            current_violations.append("System resource limits exceeded")
-            safe = False
+            mask |= _Violation.RESOURCES
 
         # Check hardware connections
         if not self._check_hardware_connections():
-            current_violations.append("Hardware connection issues detected")
-            safe = False
-
-        # Update violation list
-        if current_violations != self.safety_violations:
-            self.safety_violations = current_violations
-            if current_violations:
-                logger.warning(f"Safety violations: {current_violations}")
+            mask |= _Violation.HARDWARE
+
+        # Single int compare in the steady state; the readable list is
+        # only materialized when the mask actually changes
+        if mask != self._violation_mask:
+            self._violation_mask = mask
+            if mask:
+                logger.warning("Safety violations: %s", self.safety_violations)
             else:
                 logger.info("All safety conditions restored")
 
-        return safe
+        return not mask
+
+    def _assert_loop_thread(self) -> None:
+        """Debug check that mutable state is only touched from the loop.
+
+        No-op until monitoring starts, and compiled away entirely under
+        python -O; this documents and enforces the single-threaded
+        invariant without paying for locks.
+        """
+        assert (
+            self._loop_tid is None or threading.get_ident() == self._loop_tid
+        ), "SafetyManager state mutated off the event-loop thread"
+
+    @property
+    def pump_timeouts(self) -> Dict[int, int]:
+        """Active pump deadlines as {pin: deadline_ns}, built on demand."""
+        return {
+            pin: self._deadlines[slot]
+            for pin, slot in self._pin_to_slot.items()
+            if self._deadlines[slot] != _NO_DEADLINE
+        }
+
+    @property
+    def safety_violations(self) -> List[str]:
+        """Human-readable list of active violations, decoded on demand."""
+        mask = self._violation_mask
+        return [msg for flag, msg in _VIOLATION_MESSAGES.items() if mask & flag]
 
     def check_pump_safety(self, pin: int) -> bool:
         """
@@ -140,7 +229,8 @@ class SafetyManager:
             return False
 
         # Check if pump is already running
-        if pin in self.pump_timeouts:
+        slot = self._pin_to_slot.get(pin)
+        if slot is not None and self._deadlines[slot] != _NO_DEADLINE:
             logger.warning(f"Pump on pin {pin} already running")
             return False
 
@@ -160,7 +250,15 @@ class SafetyManager:
         if timeout is None:
             timeout = self.max_pump_runtime
 
-        self.pump_timeouts[pin] = time.time() + timeout
+        self._assert_loop_thread()
+        deadline = time.monotonic_ns() + int(timeout * 1_000_000_000)
+        slot = self._pin_to_slot.get(pin)
+        if slot is None:
+            # Unknown pin: grow a slot once, then it is fixed-cost
+            slot = len(self._deadlines)
+            self._pin_to_slot[pin] = slot
+            self._deadlines.append(_NO_DEADLINE)
+        self._deadlines[slot] = deadline
         logger.debug(f"Registered pump start on pin {pin} with {timeout}s timeout")
 
     def register_pump_stop(self, pin: int) -> None:
@@ -170,22 +268,27 @@ class SafetyManager:
         Args:
             pin: GPIO pin number
         """
-        if pin in self.pump_timeouts:
-            del self.pump_timeouts[pin]
+        self._assert_loop_thread()
+        slot = self._pin_to_slot.get(pin)
+        if slot is not None and self._deadlines[slot] != _NO_DEADLINE:
+            self._deadlines[slot] = _NO_DEADLINE
             logger.debug(f"Registered pump stop on pin {pin}")
 
     def reset_watchdog(self) -> None:
         """Reset the watchdog timer."""
-        self.last_watchdog_reset = time.time()
+        self._assert_loop_thread()
+        self.last_watchdog_reset = time.monotonic_ns()
 
     def emergency_shutdown(self) -> None:
         """Execute emergency shutdown procedures."""
         logger.critical("SAFETY MANAGER: EMERGENCY SHUTDOWN")
 
+        self._assert_loop_thread()
         self.emergency_stop_active = True
 
         # Clear pump timeouts (they should all be stopped)
-        self.pump_timeouts.clear()
+        for slot in range(len(self._deadlines)):
+            self._deadlines[slot] = _NO_DEADLINE
 
         # Log emergency event
         logger.critical("Emergency shutdown executed by safety manager")
@@ -198,7 +301,7 @@ class SafetyManager:
 
     def _check_watchdog_timeout(self) -> bool:
         """Check if watchdog timer has expired."""
-        if time.time() - self.last_watchdog_reset > self.watchdog_timeout:
+        if time.monotonic_ns() - self.last_watchdog_reset > self._watchdog_timeout_ns:
             logger.critical("Watchdog timeout exceeded - system may be hung")
             self.emergency_shutdown()
             return False
@@ -206,15 +309,15 @@ class SafetyManager:
 
     def _check_pump_timeouts(self) -> None:
         """Check for pumps that have exceeded their timeout."""
-        current_time = time.time()
-        expired_pumps = []
+        current_time = time.monotonic_ns()
+        deadlines = self._deadlines
 
-        for pin, timeout_time in self.pump_timeouts.items():
-            if current_time > timeout_time:
-                expired_pumps.append(pin)
+        # One contiguous pass over a handful of int64 slots; idle slots
+        # hold the max-int sentinel and never compare as expired
+        for pin, slot in self._pin_to_slot.items():
+            if deadlines[slot] > current_time:
+                continue
 
-        # Force stop expired pumps
-        for pin in expired_pumps:
             logger.critical(
                 f"SAFETY: Force stopping pump on pin {pin} - timeout exceeded"
             )
@@ -223,32 +326,44 @@ class SafetyManager:
             except Exception as e:
                 logger.error(f"Failed to force stop pump {pin}: {e}")
             finally:
-                del self.pump_timeouts[pin]
+                deadlines[slot] = _NO_DEADLINE
 
     def _check_system_resources(self) -> bool:
-        """Check system resource usage."""
+        """Check system resource usage.
+
+        Sampled every Nth tick; in between, the last verdict is reused.
+        CPU usage comes from the non-blocking delta since the previous
+        sample, so this never stalls the safety cadence.
+        """
+        if _psutil is None:
+            # psutil not available, skip this check
+            return True
+
+        self._tick_count += 1
+        if self._tick_count % self._resource_check_ticks != 1:
+            return self._resources_ok
+
         try:
             # Check memory usage
-            import psutil
-
-            memory_percent = psutil.virtual_memory().percent
+            memory_percent = _psutil.virtual_memory().percent
             if memory_percent > 90:
                 logger.warning(f"High memory usage: {memory_percent}%")
+                self._resources_ok = False
                 return False
 
-            # Check CPU usage
-            cpu_percent = psutil.cpu_percent(interval=1)
+            # Check CPU usage (delta since last sample, non-blocking)
+            cpu_percent = _psutil.cpu_percent(interval=None)
             if cpu_percent > 95:
                 logger.warning(f"High CPU usage: {cpu_percent}%")
+                self._resources_ok = False
                 return False
 
+            self._resources_ok = True
             return True
 
-        except ImportError:
-            # psutil not available, skip this check
-            return True
         except Exception as e:
             logger.error(f"Error checking system resources: {e}")
+            self._resources_ok = False
             return False
 
     def _check_hardware_connections(self) -> bool:
@@ -268,10 +383,12 @@ class SafetyManager:
             "monitoring": self.monitoring,
             "emergency_stop": self.emergency_stop_active,
             "active_violations": self.safety_violations,
-            "pump_timeouts": dict(self.pump_timeouts),
+            "pump_timeouts": self.pump_timeouts,
             "watchdog_last_reset": self.last_watchdog_reset,
             "watchdog_time_remaining": max(
-                0, self.watchdog_timeout - (time.time() - self.last_watchdog_reset)
+                0.0,
+                self.watchdog_timeout
+                - (time.monotonic_ns() - self.last_watchdog_reset) / 1e9,
             ),
         }
 
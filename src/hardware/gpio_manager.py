@@ -4,12 +4,26 @@ Critical component for safe hardware control
 """
 
 import logging
+import mmap
 import os
+import struct
+import time
 from typing import Dict, List, Optional
 import threading
 
+try:
+    # Resolved once at module load; RPi.GPIO raises RuntimeError (not
+    # ImportError) when imported off-Pi
+    import RPi.GPIO as _RPI_GPIO
+except (ImportError, RuntimeError):
+    _RPI_GPIO = None  # type: ignore[assignment]
+
 logger = logging.getLogger(__name__)
 
+# Precompiled 32-bit register codec; parsing the "<I" format string on
+# every register access would cost a dict lookup plus a format parse
+_REG32 = struct.Struct("<I")
+
 
 class MockGPIO:
     """Mock GPIO implementation for testing and development."""
@@ -23,16 +37,38 @@ class MockGPIO:
     PUD_DOWN = "PUD_DOWN"
 
     def __init__(self) -> None:
-        self.pin_states: Dict[int, int] = {}
+        # Pin levels live in int bitmaps (bit n = pin n) so batch
+        # operations collapse to single mask ops; the dict/list views
+        # below decode lazily for status consumers
+        self._states = 0  # Current levels
+        self._known = 0  # Pins with an explicitly set level
+        self._setup_mask = 0
         self.pin_modes: Dict[int, str] = {}
-        self.setup_pins: List[int] = []
+
+    @property
+    def pin_states(self) -> Dict[int, int]:
+        """Decoded {pin: level} view of the state bitmap."""
+        return {
+            pin: (self._states >> pin) & 1
+            for pin in range(self._known.bit_length())
+            if (self._known >> pin) & 1
+        }
+
+    @property
+    def setup_pins(self) -> List[int]:
+        """Decoded list of pins that have been set up."""
+        return [
+            pin
+            for pin in range(self._setup_mask.bit_length())
+            if (self._setup_mask >> pin) & 1
+        ]
 
     def setmode(self, mode: str) -> None:
-        logger.debug(f"MockGPIO: setmode({mode})")
+        logger.debug("MockGPIO: setmode(%s)", mode)
 
     def setwarnings(self, enable: bool) -> None:
         """Mock implementation of setwarnings method."""
-        logger.debug(f"MockGPIO: setwarnings({enable})")
+        logger.debug("MockGPIO: setwarnings(%s)", enable)
 
     def setup(
         self,
@@ -41,26 +77,177 @@ class MockGPIO:
         initial: Optional[int] = None,
         pull_up_down: Optional[str] = None,
     ) -> None:
-        logger.debug(f"MockGPIO: setup(pin={pin}, mode={mode}, initial={initial})")
-        self.setup_pins.append(pin)
+        logger.debug("MockGPIO: setup(pin=%s, mode=%s, initial=%s)", pin, mode, initial)
+        self._setup_mask |= 1 << pin
         self.pin_modes[pin] = mode
         if initial is not None:
-            self.pin_states[pin] = initial
+            self.output(pin, initial)
 
     def output(self, pin: int, state: int) -> None:
-        logger.debug(f"MockGPIO: output(pin={pin}, state={state})")
-        self.pin_states[pin] = state
+        logger.debug("MockGPIO: output(pin=%s, state=%s)", pin, state)
+        bit = 1 << pin
+        self._known |= bit
+        if state:
+            self._states |= bit
+        else:
+            self._states &= ~bit
+
+    def output_many(self, pins: List[int], state: int) -> None:
+        """Drive several pins with one mask update."""
+        mask = 0
+        for pin in pins:
+            mask |= 1 << pin
+        self._known |= mask
+        if state:
+            self._states |= mask
+        else:
+            self._states &= ~mask
 
     def input(self, pin: int) -> int:
-        state = self.pin_states.get(pin, 0)
-        logger.debug(f"MockGPIO: input(pin={pin}) -> {state}")
+        state = (self._states >> pin) & 1
+        logger.debug("MockGPIO: input(pin=%s) -> %s", pin, state)
         return state
 
+    def input_many(self, pins: List[int]) -> int:
+        """Return the packed level bitmask; bit n is pin n's level."""
+        return self._states
+
+    def reset_state(self) -> None:
+        """Clear all pin state without tearing anything down."""
+        self._states = 0
+        self._known = 0
+        self._setup_mask = 0
+        self.pin_modes.clear()
+
     def cleanup(self) -> None:
         logger.debug("MockGPIO: cleanup()")
-        self.pin_states.clear()
-        self.pin_modes.clear()
-        self.setup_pins.clear()
+        self.reset_state()
+
+
+class MMapGPIO:
+    """
+    Direct register GPIO backend via mmap'd /dev/gpiomem.
+
+    Toggling a pin through the memory-mapped GPSET0/GPCLR0/GPLEV0
+    registers takes microseconds versus milliseconds through the
+    sysfs interface, and needs no per-call syscalls at all. The
+    mapping is opened once in __init__ and held for the lifetime of
+    the backend, so repeated set_pin/read_pin calls never reopen any
+    kernel resource. Exposes the same surface as RPi.GPIO/MockGPIO
+    so GPIOManager can use it interchangeably.
+    """
+
+    BCM = "BCM"
+    OUT = "OUT"
+    IN = "IN"
+    HIGH = 1
+    LOW = 0
+    PUD_UP = "PUD_UP"
+    PUD_DOWN = "PUD_DOWN"
+
+    # BCM283x register offsets (bytes) within the GPIO block
+    _GPFSEL0 = 0x00  # Function select, 3 bits per pin, 10 pins per register
+    _GPSET0 = 0x1C
+    _GPCLR0 = 0x28
+    _GPLEV0 = 0x34
+    _GPPUD = 0x94
+    _GPPUDCLK0 = 0x98
+    # BCM2711 (Pi 4) pull control: 2 bits per pin, 16 pins per register
+    _GPIO_PUP_PDN_CNTRL0 = 0xE4
+    _GPIO_PUP_PDN_CNTRL3 = 0xF0
+
+    # On BCM2835-BCM2837 the BCM2711-only pull registers read back the
+    # ASCII "gpio" signature, which distinguishes the two register maps
+    _LEGACY_PULL_SIGNATURE = 0x6770696F
+
+    def __init__(self) -> None:
+        fd = os.open("/dev/gpiomem", os.O_RDWR | os.O_SYNC)
+        try:
+            self._mem = mmap.mmap(fd, 0x1000)
+        finally:
+            os.close(fd)
+        self._is_bcm2711 = (
+            self._read_reg(self._GPIO_PUP_PDN_CNTRL3) != self._LEGACY_PULL_SIGNATURE
+        )
+
+    def _read_reg(self, offset: int) -> int:
+        return _REG32.unpack_from(self._mem, offset)[0]
+
+    def _write_reg(self, offset: int, value: int) -> None:
+        _REG32.pack_into(self._mem, offset, value)
+
+    def setmode(self, mode: str) -> None:
+        pass  # Register addressing is always BCM-numbered
+
+    def setwarnings(self, enable: bool) -> None:
+        pass
+
+    def setup(
+        self,
+        pin: int,
+        mode: str,
+        initial: Optional[int] = None,
+        pull_up_down: Optional[str] = None,
+    ) -> None:
+        # Function select: 3 bits per pin, 000 = input, 001 = output
+        reg = self._GPFSEL0 + 4 * (pin // 10)
+        shift = 3 * (pin % 10)
+        value = self._read_reg(reg) & ~(0b111 << shift)
+        if mode == self.OUT:
+            value |= 0b001 << shift
+        self._write_reg(reg, value)
+
+        if mode == self.OUT and initial is not None:
+            self.output(pin, initial)
+        elif mode == self.IN and pull_up_down is not None:
+            self._set_pull(pin, pull_up_down)
+
+    def _set_pull(self, pin: int, pull_up_down: str) -> None:
+        if self._is_bcm2711:
+            # Direct GPIO_PUP_PDN_CNTRL write: 2 bits per pin, 16 pins
+            # per register, 01 = pull-up, 10 = pull-down. The legacy
+            # GPPUD sequence below is a no-op on this chip, which would
+            # leave active-low safety inputs floating
+            code = 0b01 if pull_up_down == self.PUD_UP else 0b10
+            reg = self._GPIO_PUP_PDN_CNTRL0 + 4 * (pin // 16)
+            shift = 2 * (pin % 16)
+            value = self._read_reg(reg) & ~(0b11 << shift)
+            self._write_reg(reg, value | (code << shift))
+            return
+
+        # Legacy GPPUD clocking sequence (BCM2835-BCM2837)
+        code = 0b10 if pull_up_down == self.PUD_UP else 0b01
+        self._write_reg(self._GPPUD, code)
+        time.sleep(0.00001)  # Required settle time (>=150 cycles)
+        self._write_reg(self._GPPUDCLK0, 1 << pin)
+        time.sleep(0.00001)
+        self._write_reg(self._GPPUD, 0)
+        self._write_reg(self._GPPUDCLK0, 0)
+
+    def output(self, pin: int, state: int) -> None:
+        offset = self._GPSET0 if state else self._GPCLR0
+        self._write_reg(offset, 1 << pin)
+
+    def output_many(self, pins: List[int], state: int) -> None:
+        """Drive several pins with one GPSET0/GPCLR0 register store."""
+        mask = 0
+        for pin in pins:
+            mask |= 1 << pin
+        self._write_reg(self._GPSET0 if state else self._GPCLR0, mask)
+
+    def input(self, pin: int) -> int:
+        return (self._read_reg(self._GPLEV0) >> pin) & 1
+
+    def input_many(self, pins: List[int]) -> int:
+        """Sample all pin levels with a single GPLEV0 register load.
+
+        Returns the raw level bitmask; bit n holds the level of BCM
+        pin n. One register read covers every requested pin.
+        """
+        return self._read_reg(self._GPLEV0)
+
+    def cleanup(self) -> None:
+        self._mem.close()
 
 
 class GPIOManager:
@@ -71,6 +258,11 @@ class GPIOManager:
     and testing environments.
     """
 
+    # Valid GPIO pins for Raspberry Pi (BCM mode); GPIO 2-27 are
+    # generally available. Class-level frozenset: O(1) membership with
+    # no per-call allocation
+    _VALID_PINS = frozenset(range(2, 28))
+
     def __init__(self, mock: bool = False):
         """
         Initialize GPIO manager.
@@ -88,14 +280,16 @@ class GPIOManager:
             self.mock_mode = True
         else:
             try:
-                import RPi.GPIO as GPIO
-
-                self.gpio = GPIO
-                logger.info("Using real RPi.GPIO")
-            except ImportError:
-                logger.warning("RPi.GPIO not available, falling back to MockGPIO")
-                self.gpio = MockGPIO()
-                self.mock_mode = True
+                self.gpio = MMapGPIO()
+                logger.info("Using mmap'd /dev/gpiomem GPIO backend")
+            except OSError:
+                if _RPI_GPIO is not None:
+                    self.gpio = _RPI_GPIO
+                    logger.info("Using real RPi.GPIO")
+                else:
+                    logger.warning("RPi.GPIO not available, falling back to MockGPIO")
+                    self.gpio = MockGPIO()
+                    self.mock_mode = True
 
         self._initialize()
 
@@ -113,6 +307,14 @@ class GPIOManager:
                 if not self.mock_mode:
                     self.gpio.setwarnings(False)
 
+                # Snapshot backend constants once; every pin op would
+                # otherwise repeat these module-attribute lookups
+                self._OUT = self.gpio.OUT
+                self._IN = self.gpio.IN
+                self._PUD_UP = self.gpio.PUD_UP
+                self._PUD_DOWN = self.gpio.PUD_DOWN
+                self._STATES = (self.gpio.LOW, self.gpio.HIGH)
+
                 self.initialized = True
                 logger.info("GPIO system initialized")
 
@@ -133,11 +335,10 @@ class GPIOManager:
         if not isinstance(pin, int):
             raise ValueError(f"Pin must be an integer, got {type(pin)}")
 
-        # Valid GPIO pins for Raspberry Pi (BCM mode)
-        valid_pins = list(range(2, 28))  # GPIO 2-27 are generally available
-
-        if pin not in valid_pins:
-            raise ValueError(f"Invalid GPIO pin {pin}. Valid pins: {valid_pins}")
+        if pin not in self._VALID_PINS:
+            raise ValueError(
+                f"Invalid GPIO pin {pin}. Valid pins: {sorted(self._VALID_PINS)}"
+            )
 
     def setup_output_pin(self, pin: int, initial_state: bool = False) -> None:
         """
@@ -154,14 +355,42 @@ class GPIOManager:
 
         with self.lock:
             try:
-                initial = self.gpio.HIGH if initial_state else self.gpio.LOW
-                self.gpio.setup(pin, self.gpio.OUT, initial=initial)
-                logger.debug(f"Setup output pin {pin}, initial={initial_state}")
+                initial = self._STATES[initial_state]
+                self.gpio.setup(pin, self._OUT, initial=initial)
+                logger.debug("Setup output pin %s, initial=%s", pin, initial_state)
 
             except Exception as e:
                 logger.error(f"Failed to setup output pin {pin}: {e}")
                 raise
 
+    def setup_output_pins(self, pins: List[int], initial_state: bool = False) -> None:
+        """
+        Setup multiple GPIO pins as outputs in one batch.
+
+        Validates every pin up front and holds the lock once for the
+        whole batch instead of once per pin.
+
+        Args:
+            pins: GPIO pin numbers (BCM mode)
+            initial_state: Initial state for all pins (True=HIGH, False=LOW)
+
+        Raises:
+            ValueError: If any pin number is invalid
+        """
+        for pin in pins:
+            self._validate_pin(pin)
+
+        with self.lock:
+            try:
+                initial = self._STATES[initial_state]
+                for pin in pins:
+                    self.gpio.setup(pin, self._OUT, initial=initial)
+                logger.debug("Setup output pins %s, initial=%s", pins, initial_state)
+
+            except Exception as e:
+                logger.error(f"Failed to setup output pins {pins}: {e}")
+                raise
+
     def setup_input_pin(self, pin: int, pull_up: bool = False) -> None:
         """
         Setup a GPIO pin as input.
@@ -177,14 +406,42 @@ class GPIOManager:
 
         with self.lock:
             try:
-                pull = self.gpio.PUD_UP if pull_up else self.gpio.PUD_DOWN
-                self.gpio.setup(pin, self.gpio.IN, pull_up_down=pull)
-                logger.debug(f"Setup input pin {pin}, pull_up={pull_up}")
+                pull = self._PUD_UP if pull_up else self._PUD_DOWN
+                self.gpio.setup(pin, self._IN, pull_up_down=pull)
+                logger.debug("Setup input pin %s, pull_up=%s", pin, pull_up)
 
             except Exception as e:
                 logger.error(f"Failed to setup input pin {pin}: {e}")
                 raise
 
+    def setup_input_pins(self, pins: List[int], pull_up: bool = False) -> None:
+        """
+        Setup multiple GPIO pins as inputs in one batch.
+
+        Validates every pin up front and holds the lock once for the
+        whole batch instead of once per pin.
+
+        Args:
+            pins: GPIO pin numbers (BCM mode)
+            pull_up: Enable internal pull-up resistors on all pins
+
+        Raises:
+            ValueError: If any pin number is invalid
+        """
+        for pin in pins:
+            self._validate_pin(pin)
+
+        with self.lock:
+            try:
+                pull = self._PUD_UP if pull_up else self._PUD_DOWN
+                for pin in pins:
+                    self.gpio.setup(pin, self._IN, pull_up_down=pull)
+                logger.debug("Setup input pins %s, pull_up=%s", pins, pull_up)
+
+            except Exception as e:
+                logger.error(f"Failed to setup input pins {pins}: {e}")
+                raise
+
     def set_pin(self, pin: int, state: bool) -> None:
         """
         Set the state of an output pin.
@@ -198,14 +455,48 @@ class GPIOManager:
         """
         self._validate_pin(pin)
 
+        # Lock-free: a single output is one register store (mmap), one
+        # library call (RPi.GPIO) or one dict write (mock) - each atomic
+        # on its own, so the mutex only added per-call overhead. The
+        # lock still serializes setup_* and cleanup mode changes.
+        try:
+            self.gpio.output(pin, self._STATES[state])
+            logger.debug("Set pin %s to %s", pin, state)
+
+        except Exception as e:
+            logger.error(f"Failed to set pin {pin} to {state}: {e}")
+            raise
+
+    def set_pins_bulk(self, pins: List[int], state: bool) -> None:
+        """
+        Set several output pins to the same state in one batch.
+
+        Uses a single register store on the mmap backend; other
+        backends are driven per pin under one lock acquisition.
+
+        Args:
+            pins: GPIO pin numbers
+            state: True for HIGH, False for LOW
+
+        Raises:
+            ValueError: If any pin number is invalid
+        """
+        for pin in pins:
+            self._validate_pin(pin)
+
         with self.lock:
             try:
-                gpio_state = self.gpio.HIGH if state else self.gpio.LOW
-                self.gpio.output(pin, gpio_state)
-                logger.debug(f"Set pin {pin} to {state}")
+                gpio_state = self._STATES[state]
+                output_many = getattr(self.gpio, "output_many", None)
+                if output_many is not None:
+                    output_many(pins, gpio_state)
+                else:
+                    for pin in pins:
+                        self.gpio.output(pin, gpio_state)
+                logger.debug("Set pins %s to %s", pins, state)
 
             except Exception as e:
-                logger.error(f"Failed to set pin {pin} to {state}: {e}")
+                logger.error(f"Failed to set pins {pins} to {state}: {e}")
                 raise
 
     def read_pin(self, pin: int) -> bool:
@@ -223,17 +514,115 @@ class GPIOManager:
         """
         self._validate_pin(pin)
 
+        # Lock-free for the same reason as set_pin: a single input is
+        # atomic on every backend, so no mutex is needed on the hot path
+        try:
+            state = self.gpio.input(pin)
+            result = bool(state)
+            logger.debug("Read pin %s: %s", pin, result)
+            return result
+
+        except Exception as e:
+            logger.error(f"Failed to read pin {pin}: {e}")
+            return False
+
+    def add_edge_callback(
+        self, pin: int, callback, pull_up: Optional[bool] = None
+    ) -> bool:
+        """
+        Register a callback fired on both edges of an input pin.
+
+        RPi.GPIO brings its own kernel event thread. The mmap backend
+        has no event source (/dev/gpiomem exposes no line events), so
+        on real hardware its pins are mirrored into RPi.GPIO just for
+        event detection while reads and writes stay on the registers.
+        Only the mock backend (or a Pi without RPi.GPIO) returns False,
+        and callers must keep polling then. The callback runs on the
+        event thread with the pin as argument.
+
+        Args:
+            pin: GPIO pin number
+            callback: Called as callback(pin) on each edge
+            pull_up: Pull to re-apply if the pin must be mirrored into
+                RPi.GPIO; None leaves the pull configuration alone
+
+        Returns:
+            bool: True if edge events were registered
+
+        Raises:
+            ValueError: If pin number is invalid
+        """
+        self._validate_pin(pin)
+
+        add_event = getattr(self.gpio, "add_event_detect", None)
+        both = getattr(self.gpio, "BOTH", None)
+        if add_event is None or both is None:
+            if self.mock_mode or _RPI_GPIO is None:
+                return False
+            try:
+                _RPI_GPIO.setmode(_RPI_GPIO.BCM)
+                _RPI_GPIO.setwarnings(False)
+                if pull_up is None:
+                    _RPI_GPIO.setup(pin, _RPI_GPIO.IN)
+                else:
+                    _RPI_GPIO.setup(
+                        pin,
+                        _RPI_GPIO.IN,
+                        pull_up_down=(
+                            _RPI_GPIO.PUD_UP if pull_up else _RPI_GPIO.PUD_DOWN
+                        ),
+                    )
+            except Exception as e:
+                logger.error(f"Failed to mirror pin {pin} for edge events: {e}")
+                return False
+            add_event = _RPI_GPIO.add_event_detect
+            both = _RPI_GPIO.BOTH
+
         with self.lock:
             try:
-                state = self.gpio.input(pin)
-                result = bool(state)
-                logger.debug(f"Read pin {pin}: {result}")
-                return result
+                add_event(pin, both, callback=callback)
+                logger.debug("Registered edge callback on pin %s", pin)
+                return True
 
             except Exception as e:
-                logger.error(f"Failed to read pin {pin}: {e}")
+                logger.error(f"Failed to register edge callback on pin {pin}: {e}")
                 return False
 
+    def read_pins(self, pins: List[int]) -> Dict[int, bool]:
+        """
+        Read several input pins in one batch.
+
+        A single GPLEV0 register load covers all pins on the mmap
+        backend; other backends are read per pin under one lock
+        acquisition instead of one per call.
+
+        Args:
+            pins: GPIO pin numbers
+
+        Returns:
+            Dict mapping pin numbers to their states (True if HIGH)
+
+        Raises:
+            ValueError: If any pin number is invalid
+        """
+        for pin in pins:
+            self._validate_pin(pin)
+
+        with self.lock:
+            try:
+                input_many = getattr(self.gpio, "input_many", None)
+                if input_many is not None:
+                    levels = input_many(pins)
+                    states = {pin: bool((levels >> pin) & 1) for pin in pins}
+                else:
+                    states = {pin: bool(self.gpio.input(pin)) for pin in pins}
+                logger.debug("Read pins %s: %s", pins, states)
+                return states
+
+            except Exception as e:
+                logger.error(f"Failed to read pins {pins}: {e}")
+                return {pin: False for pin in pins}
+
     def cleanup(self) -> None:
         """Clean up GPIO resources."""
         with self.lock:
@@ -246,6 +635,19 @@ class GPIOManager:
             except Exception as e:
                 logger.error(f"Error during GPIO cleanup: {e}")
 
+    def reset_state(self) -> None:
+        """Clear mock pin state without tearing the backend down.
+
+        Lets tests that share one manager start each case from a clean
+        slate without paying cleanup() plus re-initialization per test.
+        Only meaningful for the mock backend; real hardware backends
+        are left untouched.
+        """
+        with self.lock:
+            reset = getattr(self.gpio, "reset_state", None)
+            if reset is not None:
+                reset()
+
     def get_pin_states(self) -> Dict[int, bool]:
         """
         Get current states of all configured pins (mock mode only).
@@ -4,13 +4,45 @@ Handles calibration, reading, and data validation
 """
 
 import asyncio
+import functools
+import json
 import logging
 import os
 import time
-from typing import Dict, List, Optional, Tuple, Union, Any
+from random import Random
+from typing import Callable, Dict, List, Optional, Tuple, Union, Any
+
+try:
+    import numpy as np
+except ImportError:
+    np = None  # type: ignore[assignment]
+
+try:
+    import smbus2
+except ImportError:
+    smbus2 = None  # type: ignore[assignment]
 
 logger = logging.getLogger(__name__)
 
+# Seeded PRNG for mock readings: deterministic across test runs and
+# independent of the global random state
+_MOCK_RNG = Random(0xC417B)
+
+
+@functools.lru_cache(maxsize=None)
+def _parse_sensor_addresses(addresses_str: str) -> Tuple[int, ...]:
+    """Parse a comma-separated address list, cached on the raw string."""
+    addresses = []
+
+    for addr_str in addresses_str.split(","):
+        try:
+            addr = int(addr_str.strip(), 0)  # Support both decimal and hex
+            addresses.append(addr)
+        except ValueError:
+            logger.warning(f"Invalid sensor address: {addr_str}")
+
+    return tuple(addresses)
+
 
 class MockI2C:
     """Mock I2C implementation for testing."""
@@ -21,15 +53,13 @@ class MockI2C:
     def write_byte(self, address: int, value: int) -> None:
         if address not in self.devices:
             self.devices[address] = {}
-        logger.debug(f"MockI2C: write_byte(0x{address:02x}, 0x{value:02x})")
+        logger.debug("MockI2C: write_byte(0x%02x, 0x%02x)", address, value)
 
     def read_word_data(self, address: int, register: int) -> int:
         # Simulate moisture reading (0-1023 range)
-        import random
-
-        value = random.randint(200, 800)  # Typical moisture range  # nosec B311
+        value = _MOCK_RNG.randint(200, 800)  # Typical moisture range  # nosec B311
         logger.debug(
-            f"MockI2C: read_word_data(0x{address:02x}, 0x{register:02x}) -> {value}"
+            "MockI2C: read_word_data(0x%02x, 0x%02x) -> %s", address, register, value
         )
         return value
 
@@ -54,6 +84,10 @@ class MoistureSensorManager:
     CMD_SLEEP = 0x08
     CMD_GET_BUSY = 0x09
 
+    # Default calibration values for uncalibrated sensors
+    DEFAULT_DRY = 500  # Typical dry reading
+    DEFAULT_WET = 200  # Typical wet reading
+
     def __init__(self, bus_number: int = 1):
         """
         Initialize moisture sensor manager.
@@ -66,9 +100,29 @@ class MoistureSensorManager:
         self.sensor_addresses = self._get_sensor_addresses()
         self.calibration_data: Dict[int, Tuple[int, int]] = {}  # (dry_value, wet_value)
         self.last_readings: Dict[str, float] = {}
-        self.last_read_time: Dict[int, float] = {}
+        self.last_read_time: Dict[int, int] = {}  # monotonic-ns timestamps
         self.cache_duration = 5.0  # Cache readings for 5 seconds
+        # Expiry math runs on monotonic-ns ints: immune to wall-clock
+        # jumps and a plain integer compare per check
+        self._cache_duration_ns = int(self.cache_duration * 1_000_000_000)
         self.mock_mode = os.getenv("MOCK_HARDWARE", "false").lower() == "true"
+        # SMBus transactions are not concurrent-safe; this serializes
+        # whole write/wait/read sequences so overlapping callers (main
+        # loop, calibration, edge-triggered reads) cannot interleave
+        # commands mid-measurement
+        self._bus_lock = asyncio.Lock()
+        # mtime of the calibration file at last load; unchanged files
+        # are not re-read on repeated initialize() calls
+        self._calibration_mtime_ns: Optional[int] = None
+        # Parallel calibration arrays for the vectorized conversion
+        # path; rebuilt lazily whenever calibration data changes
+        self._addr_to_idx: Dict[int, int] = {}
+        self._cal_dry: Any = None
+        self._cal_wet: Any = None
+        self._cal_dirty = True
+        # Per-sensor conversion closures with calibration constants
+        # baked in; built lazily, cleared when calibration changes
+        self._converters: Dict[int, Callable[[float], float]] = {}
 
         logger.info(
             f"MoistureSensorManager initialized with addresses: "
@@ -78,16 +132,7 @@ class MoistureSensorManager:
     def _get_sensor_addresses(self) -> List[int]:
         """Get sensor I2C addresses from environment."""
         addresses_str = os.getenv("MOISTURE_SENSOR_ADDRESSES", "0x20,0x21,0x22,0x23")
-        addresses = []
-
-        for addr_str in addresses_str.split(","):
-            try:
-                addr = int(addr_str.strip(), 0)  # Support both decimal and hex
-                addresses.append(addr)
-            except ValueError:
-                logger.warning(f"Invalid sensor address: {addr_str}")
-
-        return addresses
+        return list(_parse_sensor_addresses(addresses_str))
 
     async def initialize(self) -> None:
         """Initialize I2C bus and detect sensors."""
@@ -96,8 +141,8 @@ class MoistureSensorManager:
                 logger.info("Using mock I2C for testing")
                 self.bus = MockI2C()
             else:
-                import smbus2
-
+                if smbus2 is None:
+                    raise RuntimeError("smbus2 not available")
                 self.bus = smbus2.SMBus(self.bus_number)
                 logger.info(f"I2C bus {self.bus_number} initialized")
 
@@ -130,10 +175,10 @@ class MoistureSensorManager:
                     version = self.bus.read_word_data(address, 0)
                     if version > 0:
                         detected.append(address)
-                        logger.debug(f"Sensor at 0x{address:02x} version: {version}")
+                        logger.debug("Sensor at 0x%02x version: %s", address, version)
 
             except Exception as e:
-                logger.debug(f"No sensor found at 0x{address:02x}: {e}")
+                logger.debug("No sensor found at 0x%02x: %s", address, e)
 
         return detected
 
@@ -141,25 +186,119 @@ class MoistureSensorManager:
         """
         Read all moisture sensors.
 
+        Stale sensors are read as a pipelined batch: the capacitance
+        command goes out to every sensor first, a single settle sleep
+        covers all of them, then the results are collected - so N
+        sensors cost one 100ms wait instead of N.
+
         Returns:
             Dict mapping sensor IDs to moisture percentages
         """
         readings = {}
+        current_time = time.monotonic_ns()
 
+        # Serve fresh values from cache, batch-read the rest
+        stale = []
         for address in self.sensor_addresses:
-            try:
-                moisture_percent = await self.read_sensor(address)
-                if moisture_percent is not None:
-                    sensor_id = f"moisture_{address:02x}"
-                    readings[sensor_id] = moisture_percent
-
-            except Exception as e:
-                logger.error(f"Error reading sensor 0x{address:02x}: {e}")
+            last_read = self.last_read_time.get(address)
+            if (
+                last_read is not None
+                and current_time - last_read < self._cache_duration_ns
+            ):
+                cached = self.last_readings.get(f"moisture_{address:02x}")
+                if cached is not None:
+                    readings[f"moisture_{address:02x}"] = cached
+            else:
+                stale.append(address)
+
+        raw_values = await self._read_raw_batch(stale) if stale else {}
+
+        if np is not None and raw_values:
+            # Vectorized path: one clipped arithmetic pass over all raw
+            # values; the clip makes every result a valid percentage
+            if self._cal_dirty:
+                self._rebuild_cal_arrays()
+
+            addrs = list(raw_values)
+            count = len(addrs)
+            idx = np.fromiter(
+                (self._addr_to_idx[a] for a in addrs), dtype=np.intp, count=count
+            )
+            raws = np.fromiter(raw_values.values(), dtype=np.float64, count=count)
+            dry = self._cal_dry[idx]
+            denom = dry - self._cal_wet[idx]
+
+            with np.errstate(divide="ignore", invalid="ignore"):
+                pcts = np.clip((dry - raws) * 100.0 / denom, 0.0, 100.0)
+            # Sensors without a calibration range fall back to midpoint
+            pcts = np.where(denom == 0.0, 50.0, pcts)
+
+            for address, moisture_percent in zip(addrs, pcts.tolist()):
+                self.last_read_time[address] = current_time
+                readings[f"moisture_{address:02x}"] = moisture_percent
+        else:
+            for address, raw_value in raw_values.items():
+                moisture_percent = self._convert_to_percentage(address, raw_value)
+
+                if self._validate_reading(moisture_percent):
+                    self.last_read_time[address] = current_time
+                    readings[f"moisture_{address:02x}"] = moisture_percent
+                else:
+                    logger.warning(
+                        f"Invalid reading from sensor 0x{address:02x}: "
+                        f"{moisture_percent}%"
+                    )
 
         # Update cache
         self.last_readings.update(readings)
         return readings
 
+    async def _read_raw_batch(self, addresses: List[int]) -> Dict[int, int]:
+        """
+        Read raw capacitance from several sensors with one settle wait.
+
+        Args:
+            addresses: Sensor I2C addresses to read
+
+        Returns:
+            Dict mapping addresses to raw values; failed sensors are
+            logged and omitted
+        """
+        raw_values: Dict[int, int] = {}
+
+        if self.bus is None:
+            logger.error("I2C bus not initialized")
+            return raw_values
+
+        if self.mock_mode:
+            for address in addresses:
+                raw_values[address] = self.bus.read_word_data(
+                    address, self.CMD_GET_CAPACITANCE
+                )
+            return raw_values
+
+        async with self._bus_lock:
+            # Kick off the measurement on every sensor before waiting
+            started = []
+            for address in addresses:
+                try:
+                    self.bus.write_byte(address, self.CMD_GET_CAPACITANCE)
+                    started.append(address)
+                except Exception as e:
+                    logger.error(f"Error reading sensor 0x{address:02x}: {e}")
+
+            if started:
+                # One measurement wait covers all sensors
+                await asyncio.sleep(0.1)
+
+            for address in started:
+                try:
+                    raw_values[address] = self.bus.read_word_data(address, 0)
+                except Exception as e:
+                    logger.error(f"Error reading sensor 0x{address:02x}: {e}")
+
+        return raw_values
+
     async def read_sensor(self, address: int) -> Optional[float]:
         """
         Read a single moisture sensor.
@@ -170,12 +309,12 @@ class MoistureSensorManager:
         Returns:
             Moisture percentage (0-100) or None if error
         """
-        current_time = time.time()
+        current_time = time.monotonic_ns()
 
         # Check cache
         if (
             address in self.last_read_time
-            and current_time - self.last_read_time[address] < self.cache_duration
+            and current_time - self.last_read_time[address] < self._cache_duration_ns
         ):
             sensor_id = f"moisture_{address:02x}"
             return self.last_readings.get(sensor_id)
@@ -187,9 +326,10 @@ class MoistureSensorManager:
             if self.mock_mode:
                 raw_value = self.bus.read_word_data(address, self.CMD_GET_CAPACITANCE)
             else:
-                self.bus.write_byte(address, self.CMD_GET_CAPACITANCE)
-                await asyncio.sleep(0.1)  # Give sensor time to measure
-                raw_value = self.bus.read_word_data(address, 0)
+                async with self._bus_lock:
+                    self.bus.write_byte(address, self.CMD_GET_CAPACITANCE)
+                    await asyncio.sleep(0.1)  # Give sensor time to measure
+                    raw_value = self.bus.read_word_data(address, 0)
 
             # Convert to percentage using calibration
             moisture_percent = self._convert_to_percentage(address, raw_value)
@@ -219,22 +359,47 @@ class MoistureSensorManager:
         Returns:
             Moisture percentage (0-100)
         """
-        # Default calibration values if not calibrated
-        default_dry = 500  # Typical dry reading
-        default_wet = 200  # Typical wet reading
+        converter = self._converters.get(address)
+        if converter is None:
+            dry_value, wet_value = self.calibration_data.get(
+                address, (self.DEFAULT_DRY, self.DEFAULT_WET)
+            )
+            converter = self._make_converter(dry_value, wet_value)
+            self._converters[address] = converter
+
+        return converter(raw_value)
+
+    @staticmethod
+    def _make_converter(dry_value: int, wet_value: int) -> Callable[[float], float]:
+        """Build a conversion closure with calibration constants baked in.
+
+        The returned function is inverted (lower capacitance = higher
+        moisture), clamps to 0-100, and avoids the per-call calibration
+        dict lookup of the generic path.
+        """
+        if dry_value == wet_value:
+            return lambda raw_value: 50.0  # Default if no calibration range
 
-        dry_value, wet_value = self.calibration_data.get(
-            address, (default_dry, default_wet)
-        )
+        inv_range = 100.0 / (dry_value - wet_value)
+        dry = float(dry_value)
 
-        # Convert to percentage (inverted since lower capacitance = higher moisture)
-        if dry_value == wet_value:
-            return 50.0  # Default if no calibration range
+        return lambda raw_value: max(0.0, min(100.0, (dry - raw_value) * inv_range))
+
+    def _rebuild_cal_arrays(self) -> None:
+        """Repopulate the parallel calibration arrays (numpy only)."""
+        addresses = self.sensor_addresses
+        self._addr_to_idx = {addr: i for i, addr in enumerate(addresses)}
+        dry = np.empty(len(addresses), dtype=np.float64)
+        wet = np.empty(len(addresses), dtype=np.float64)
 
-        percentage = ((dry_value - raw_value) / (dry_value - wet_value)) * 100
+        for i, addr in enumerate(addresses):
+            dry[i], wet[i] = self.calibration_data.get(
+                addr, (self.DEFAULT_DRY, self.DEFAULT_WET)
+            )
 
-        # Clamp to 0-100 range
-        return max(0.0, min(100.0, percentage))
+        self._cal_dry = dry
+        self._cal_wet = wet
+        self._cal_dirty = False
 
     def _validate_reading(self, value: float) -> bool:
         """
@@ -260,6 +425,8 @@ class MoistureSensorManager:
             wet_value: Raw reading when fully saturated
         """
         self.calibration_data[address] = (dry_value, wet_value)
+        self._cal_dirty = True
+        self._converters.pop(address, None)
         logger.info(
             f"Calibrated sensor 0x{address:02x}: dry={dry_value}, wet={wet_value}"
         )
@@ -270,33 +437,67 @@ class MoistureSensorManager:
     async def _load_calibration(self) -> None:
         """Load calibration data from file."""
         try:
-            import yaml
+            calibration_file = "config/moisture_calibration.json"
 
-            calibration_file = "config/moisture_calibration.yaml"
+            try:
+                mtime_ns = os.stat(calibration_file).st_mtime_ns
+            except FileNotFoundError:
+                self._load_legacy_calibration()
+                return
 
-            if os.path.exists(calibration_file):
-                with open(calibration_file, "r") as f:
-                    data = yaml.safe_load(f)
+            if mtime_ns == self._calibration_mtime_ns:
+                logger.debug("Calibration file unchanged, skipping reload")
+                return
 
-                for addr_str, values in data.items():
-                    address = int(addr_str, 0)
-                    self.calibration_data[address] = (values["dry"], values["wet"])
+            with open(calibration_file, "r") as f:
+                data = json.load(f)
 
-                logger.info(
-                    f"Loaded calibration for {len(self.calibration_data)} sensors"
-                )
-            else:
-                logger.info("No calibration file found, using defaults")
+            for addr_str, values in data.items():
+                address = int(addr_str, 0)
+                self.calibration_data[address] = (values["dry"], values["wet"])
+
+            self._calibration_mtime_ns = mtime_ns
+            self._cal_dirty = True
+            self._converters.clear()
+            logger.info(
+                f"Loaded calibration for {len(self.calibration_data)} sensors"
+            )
 
         except Exception as e:
             logger.error(f"Error loading calibration: {e}")
 
+    def _load_legacy_calibration(self) -> None:
+        """Load calibration from the old YAML file, if present.
+
+        Kept so existing installations migrate transparently; the next
+        save rewrites the data as JSON. PyYAML is only imported on this
+        path, keeping it off the normal init sequence.
+        """
+        legacy_file = "config/moisture_calibration.yaml"
+
+        if not os.path.exists(legacy_file):
+            logger.info("No calibration file found, using defaults")
+            return
+
+        import yaml
+
+        with open(legacy_file, "r") as f:
+            data = yaml.safe_load(f)
+
+        for addr_str, values in data.items():
+            address = int(addr_str, 0)
+            self.calibration_data[address] = (values["dry"], values["wet"])
+
+        self._cal_dirty = True
+        self._converters.clear()
+        logger.info(
+            f"Loaded legacy calibration for {len(self.calibration_data)} sensors"
+        )
+
     async def _save_calibration(self) -> None:
         """Save calibration data to file."""
         try:
-            import yaml
-
-            calibration_file = "config/moisture_calibration.yaml"
+            calibration_file = "config/moisture_calibration.json"
 
             # Create config directory if it doesn't exist
             os.makedirs(os.path.dirname(calibration_file), exist_ok=True)
@@ -307,7 +508,7 @@ class MoistureSensorManager:
                 data[f"0x{address:02x}"] = {"dry": dry, "wet": wet}
 
             with open(calibration_file, "w") as f:
-                yaml.dump(data, f, default_flow_style=False)
+                json.dump(data, f, indent=2)
 
             logger.info("Calibration data saved")
 
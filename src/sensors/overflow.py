@@ -4,9 +4,10 @@ Critical safety component to prevent water damage
 """
 
 import asyncio
+import functools
 import logging
 import os
-from typing import Dict, List, Callable, Any, TYPE_CHECKING
+from typing import Dict, List, Callable, Any, Optional, Tuple, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from ..hardware.gpio_manager import GPIOManager
@@ -14,6 +15,21 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=None)
+def _parse_sensor_pins(pins_str: str) -> Tuple[int, ...]:
+    """Parse a comma-separated pin list, cached on the raw string."""
+    pins = []
+
+    for pin_str in pins_str.split(","):
+        try:
+            pin = int(pin_str.strip())
+            pins.append(pin)
+        except ValueError:
+            logger.warning(f"Invalid overflow sensor pin: {pin_str}")
+
+    return tuple(pins)
+
+
 class OverflowSensorManager:
     """
     Manager for overflow detection using float switches.
@@ -32,32 +48,46 @@ class OverflowSensorManager:
         """
         self.gpio_manager = gpio_manager
         self.sensor_pins = self._get_sensor_pins()
+        # Per-pin bit positions so overflow state packs into one int;
+        # "any overflow?" is then a single mask test
+        self._pin_bit = {pin: 1 << i for i, pin in enumerate(self.sensor_pins)}
+        self._all_mask = (1 << len(self.sensor_pins)) - 1
         self.last_readings: Dict[str, bool] = {}
         self.overflow_detected = False
-        self.alert_callbacks: List[Callable[[str], Any]] = []
+        # Callbacks are partitioned at registration so alert fanout
+        # never re-inspects them; async ones run concurrently
+        self._sync_callbacks: List[Callable[[str], Any]] = []
+        self._async_callbacks: List[Callable[[str], Any]] = []
+        # Pins with kernel edge detection; alerts on these fire at
+        # interrupt latency instead of waiting for the next poll
+        self._edge_pins: List[int] = []
+        self._event_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._edge_read_task: Optional["asyncio.Task[Dict[str, bool]]"] = None
 
         logger.info(f"OverflowSensorManager initialized with pins: {self.sensor_pins}")
 
     def _get_sensor_pins(self) -> List[int]:
         """Get overflow sensor pins from environment."""
         pins_str = os.getenv("OVERFLOW_SENSOR_PINS", "21,22,23,24")
-        pins = []
-
-        for pin_str in pins_str.split(","):
-            try:
-                pin = int(pin_str.strip())
-                pins.append(pin)
-            except ValueError:
-                logger.warning(f"Invalid overflow sensor pin: {pin_str}")
-
-        return pins
+        return list(_parse_sensor_pins(pins_str))
 
     async def initialize(self) -> None:
         """Initialize overflow sensors."""
         try:
-            # Setup GPIO pins as inputs with pull-up resistors
-            for pin in self.sensor_pins:
-                self.gpio_manager.setup_input_pin(pin, pull_up=True)
+            # Setup GPIO pins as inputs with pull-up resistors, batched
+            # under one lock acquisition and validation sweep
+            self.gpio_manager.setup_input_pins(self.sensor_pins, pull_up=True)
+
+            # Register edge callbacks where the backend supports them;
+            # pins without event support stay on the polled read_all path
+            self._event_loop = asyncio.get_running_loop()
+            self._edge_pins = [
+                pin
+                for pin in self.sensor_pins
+                if self.gpio_manager.add_edge_callback(pin, self._on_edge, pull_up=True)
+            ]
+            if self._edge_pins:
+                logger.info(f"Edge events active on pins: {self._edge_pins}")
 
             logger.info(f"Initialized {len(self.sensor_pins)} overflow sensors")
 
@@ -72,25 +102,31 @@ class OverflowSensorManager:
         Returns:
             Dict mapping sensor IDs to overflow status (True = overflow detected)
         """
-        readings = {}
-        overflow_detected = False
+        values_mask = 0
+        try:
+            # One batched read covers every float switch: a single lock
+            # acquisition and, on the mmap backend, one register load
+            pin_states = self.gpio_manager.read_pins(self.sensor_pins)
+            for pin, state in pin_states.items():
+                if state:
+                    values_mask |= self._pin_bit[pin]
+        except Exception as e:
+            logger.error(f"Error reading overflow sensors: {e}")
+            # values_mask stays 0: all-low reads as all-active below,
+            # which assumes overflow for safety
 
-        for pin in self.sensor_pins:
-            try:
-                # Read sensor (float switches are typically active low)
-                sensor_active = not self.gpio_manager.read_pin(pin)
-                sensor_id = f"overflow_{pin}"
-                readings[sensor_id] = sensor_active
+        # Float switches are typically active low, so a cleared level
+        # bit means the switch has tripped; one int op answers "any?"
+        active_mask = ~values_mask & self._all_mask
+        overflow_detected = active_mask != 0
 
-                if sensor_active:
-                    overflow_detected = True
-                    logger.warning(f"OVERFLOW DETECTED on pin {pin}")
+        readings = {}
+        for pin in self.sensor_pins:
+            sensor_active = bool(active_mask & self._pin_bit[pin])
+            readings[f"overflow_{pin}"] = sensor_active
 
-            except Exception as e:
-                logger.error(f"Error reading overflow sensor pin {pin}: {e}")
-                # Assume overflow for safety
-                readings[f"overflow_{pin}"] = True
-                overflow_detected = True
+            if sensor_active:
+                logger.warning(f"OVERFLOW DETECTED on pin {pin}")
 
         # Update state
         previous_overflow = self.overflow_detected
@@ -102,10 +138,33 @@ class OverflowSensorManager:
         elif not overflow_detected and previous_overflow:
             await self._trigger_clear_alert()
 
-        # Update cache
-        self.last_readings.update(readings)
+        # Publish the cache by pointer swap: readings always covers
+        # every pin, so this skips the second dict walk update() would
+        # do and status consumers see a consistent snapshot
+        self.last_readings = readings
         return readings
 
+    def _on_edge(self, pin: int) -> None:
+        """Handle a GPIO edge event from the backend's event thread.
+
+        Marshals onto the event loop and re-runs read_all there, so the
+        existing transition/alert logic stays the single source of truth
+        while the alert fires immediately instead of on the next poll.
+        """
+        loop = self._event_loop
+        if loop is not None and not loop.is_closed():
+            loop.call_soon_threadsafe(self._schedule_edge_read)
+
+    def _schedule_edge_read(self) -> None:
+        """Kick off an immediate sensor read on the event loop."""
+        # The loop holds tasks only weakly, so keep our own reference
+        # or the read can be garbage-collected mid-flight; a read
+        # already in progress will observe the new level anyway
+        task = self._edge_read_task
+        if task is not None and not task.done():
+            return
+        self._edge_read_task = asyncio.ensure_future(self.read_all())
+
     async def check_overflow(self) -> bool:
         """
         Quick overflow check.
@@ -113,34 +172,39 @@ class OverflowSensorManager:
         Returns:
             True if any overflow sensor is active
         """
-        readings = await self.read_all()
-        return any(readings.values())
+        await self.read_all()
+        return self.overflow_detected
 
     async def _trigger_overflow_alert(self) -> None:
         """Trigger overflow alert callbacks."""
         logger.critical("OVERFLOW ALERT: Water level too high!")
-
-        for callback in self.alert_callbacks:
-            try:
-                if asyncio.iscoroutinefunction(callback):
-                    await callback("overflow_detected")
-                else:
-                    callback("overflow_detected")
-            except Exception as e:
-                logger.error(f"Error in overflow alert callback: {e}")
+        await self._dispatch_alert("overflow_detected")
 
     async def _trigger_clear_alert(self) -> None:
         """Trigger overflow cleared alert."""
         logger.info("Overflow condition cleared")
+        await self._dispatch_alert("overflow_cleared")
+
+    async def _dispatch_alert(self, event: str) -> None:
+        """Fan an event out to all callbacks.
 
-        for callback in self.alert_callbacks:
+        Sync callbacks run inline; async ones are gathered so slow
+        notifiers (Telegram, SMS) overlap instead of queueing.
+        """
+        for callback in self._sync_callbacks:
             try:
-                if asyncio.iscoroutinefunction(callback):
-                    await callback("overflow_cleared")
-                else:
-                    callback("overflow_cleared")
+                callback(event)
             except Exception as e:
-                logger.error(f"Error in clear alert callback: {e}")
+                logger.error(f"Error in overflow alert callback: {e}")
+
+        if self._async_callbacks:
+            results = await asyncio.gather(
+                *(callback(event) for callback in self._async_callbacks),
+                return_exceptions=True,
+            )
+            for result in results:
+                if isinstance(result, Exception):
+                    logger.error(f"Error in overflow alert callback: {result}")
 
     def add_alert_callback(self, callback: Callable[[str], Any]) -> None:
         """
@@ -149,7 +213,12 @@ class OverflowSensorManager:
         Args:
             callback: Function to call on overflow events
         """
-        self.alert_callbacks.append(callback)
+        # Classify once here; iscoroutinefunction is too expensive to
+        # re-run on every alert dispatch
+        if asyncio.iscoroutinefunction(callback):
+            self._async_callbacks.append(callback)
+        else:
+            self._sync_callbacks.append(callback)
         logger.debug(f"Added overflow alert callback: {callback.__name__}")
 
     def remove_alert_callback(self, callback: Callable[[str], Any]) -> None:
@@ -159,15 +228,19 @@ class OverflowSensorManager:
         Args:
             callback: Function to remove
         """
-        if callback in self.alert_callbacks:
-            self.alert_callbacks.remove(callback)
-            logger.debug(f"Removed overflow alert callback: {callback.__name__}")
+        for callbacks in (self._sync_callbacks, self._async_callbacks):
+            if callback in callbacks:
+                callbacks.remove(callback)
+                logger.debug(f"Removed overflow alert callback: {callback.__name__}")
 
     def get_sensor_status(self) -> Dict:
         """Get status of all overflow sensors."""
         return {
             "sensor_pins": self.sensor_pins,
+            "edge_event_pins": self._edge_pins,
             "last_readings": self.last_readings,
             "overflow_detected": self.overflow_detected,
-            "alert_callbacks_count": len(self.alert_callbacks),
+            "alert_callbacks_count": (
+                len(self._sync_callbacks) + len(self._async_callbacks)
+            ),
         }
@@ -0,0 +1,56 @@
+"""
+Shared fixtures for all OrchidBot test packages
+"""
+
+import asyncio
+import json
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+import fastjsonschema
+import pytest
+
+# Ensure mock mode before any hardware module is imported
+os.environ.setdefault("MOCK_HARDWARE", "true")
+
+from src.core.controller import HydroponicController  # noqa: E402
+
+
+@pytest.fixture(autouse=True, scope="session")
+def _no_dotenv():
+    """Patch .env loading once for the whole session.
+
+    Replaces the per-fixture patch context managers the unit tests
+    entered around every controller construction.
+    """
+    with patch("src.core.controller.load_dotenv"):
+        yield
+
+
+@pytest.fixture(scope="session")
+def shared_controller():
+    """Single controller shared by read-only tests across the session.
+
+    Construction wires GPIO, safety, and sensor managers, so building a
+    fresh controller per test dominates setup time. Tests that only
+    read configuration or inspect wiring can share this one; tests that
+    mutate controller state should keep their own instance.
+    """
+    controller = HydroponicController()
+    yield controller
+    if getattr(controller, "running", False):
+        asyncio.run(controller.stop())
+
+
+@pytest.fixture(scope="session")
+def config_validator():
+    """Compiled controller-config schema validator, built once.
+
+    fastjsonschema compiles the schema to specialized bytecode, so the
+    structural checks (sections, types, ranges) become a single call
+    instead of a hand-written assert chain per test.
+    """
+    schema_path = Path(__file__).parent.parent / "schemas" / "controller_config.json"
+    with open(schema_path) as f:
+        return fastjsonschema.compile(json.load(f))
@@ -0,0 +1,182 @@
+"""
+Unit tests for the GPIO backends and batch helpers
+
+The MMapGPIO tests exercise the register math against a plain
+bytearray standing in for the mmap'd GPIO block, so they verify bit
+positions and encodings without touching /dev/gpiomem.
+"""
+
+import struct
+
+import pytest
+
+from src.hardware.gpio_manager import GPIOManager, MMapGPIO
+
+_REG32 = struct.Struct("<I")
+
+
+def _make_mmap_gpio(bcm2711: bool = True) -> MMapGPIO:
+    """Build an MMapGPIO over fake register memory, skipping __init__."""
+    gpio = MMapGPIO.__new__(MMapGPIO)
+    gpio._mem = bytearray(0x1000)
+    gpio._is_bcm2711 = bcm2711
+    return gpio
+
+
+def _reg(gpio: MMapGPIO, offset: int) -> int:
+    return _REG32.unpack_from(gpio._mem, offset)[0]
+
+
+class TestMMapGPIORegisterMath:
+    """Verify register offsets and bit encodings of the mmap backend."""
+
+    def test_function_select_output(self):
+        """Pin 17 lives in GPFSEL1 at bits 21-23; output is 001."""
+        gpio = _make_mmap_gpio()
+        gpio.setup(17, gpio.OUT)
+
+        assert _reg(gpio, 0x04) == 0b001 << 21
+
+    def test_function_select_input_clears_bits(self):
+        """Reconfiguring as input zeroes the pin's function field only."""
+        gpio = _make_mmap_gpio()
+        gpio.setup(20, gpio.OUT)
+        gpio.setup(21, gpio.OUT)
+        gpio.setup(20, gpio.IN)
+
+        # GPFSEL2: pin 20 at bits 0-2 cleared, pin 21 at bits 3-5 kept
+        assert _reg(gpio, 0x08) == 0b001 << 3
+
+    def test_output_uses_set_and_clear_registers(self):
+        """High goes through GPSET0, low through GPCLR0."""
+        gpio = _make_mmap_gpio()
+        gpio.output(5, 1)
+        assert _reg(gpio, 0x1C) == 1 << 5
+
+        gpio.output(5, 0)
+        assert _reg(gpio, 0x28) == 1 << 5
+
+    def test_output_many_single_mask(self):
+        """A batch write lands as one combined mask."""
+        gpio = _make_mmap_gpio()
+        gpio.output_many([18, 19, 26], 1)
+
+        assert _reg(gpio, 0x1C) == (1 << 18) | (1 << 19) | (1 << 26)
+
+    def test_input_reads_level_register(self):
+        """input() extracts the pin's bit from GPLEV0."""
+        gpio = _make_mmap_gpio()
+        _REG32.pack_into(gpio._mem, 0x34, (1 << 21) | (1 << 23))
+
+        assert gpio.input(21) == 1
+        assert gpio.input(22) == 0
+        assert gpio.input(23) == 1
+
+    def test_input_many_returns_level_mask(self):
+        """input_many() hands back the raw GPLEV0 bitmask."""
+        gpio = _make_mmap_gpio()
+        _REG32.pack_into(gpio._mem, 0x34, (1 << 2) | (1 << 27))
+
+        assert gpio.input_many([2, 27]) == (1 << 2) | (1 << 27)
+
+    @pytest.mark.parametrize(
+        ("pin", "pull", "reg", "shift", "code"),
+        [
+            # Pin 5: first control register, 01 = pull-up
+            (5, MMapGPIO.PUD_UP, 0xE4, 10, 0b01),
+            # Pin 21 crosses into the second register (16 pins each)
+            (21, MMapGPIO.PUD_UP, 0xE8, 10, 0b01),
+            (21, MMapGPIO.PUD_DOWN, 0xE8, 10, 0b10),
+        ],
+    )
+    def test_bcm2711_pull_encoding(self, pin, pull, reg, shift, code):
+        """BCM2711 pulls: 2 bits per pin, 16 pins per register."""
+        gpio = _make_mmap_gpio(bcm2711=True)
+        gpio._set_pull(pin, pull)
+
+        assert _reg(gpio, reg) == code << shift
+
+    def test_bcm2711_pull_preserves_neighbors(self):
+        """Setting one pin's pull leaves sibling fields untouched."""
+        gpio = _make_mmap_gpio(bcm2711=True)
+        gpio._set_pull(2, gpio.PUD_UP)
+        gpio._set_pull(3, gpio.PUD_DOWN)
+
+        assert _reg(gpio, 0xE4) == (0b01 << 4) | (0b10 << 6)
+
+    def test_legacy_pull_sequence_completes(self):
+        """Legacy chips finish with GPPUD/GPPUDCLK0 cleared and never
+        touch the BCM2711 register bank."""
+        gpio = _make_mmap_gpio(bcm2711=False)
+        gpio._set_pull(5, gpio.PUD_UP)
+
+        assert _reg(gpio, 0x94) == 0
+        assert _reg(gpio, 0x98) == 0
+        assert _reg(gpio, 0xE4) == 0
+
+    def test_chip_detection_reads_signature(self, monkeypatch):
+        """BCM2835-37 return the ASCII "gpio" signature at 0xF0."""
+        legacy_mem = bytearray(0x1000)
+        _REG32.pack_into(legacy_mem, 0xF0, MMapGPIO._LEGACY_PULL_SIGNATURE)
+        bcm2711_mem = bytearray(0x1000)
+
+        monkeypatch.setattr("src.hardware.gpio_manager.os.open", lambda *a: 99)
+        monkeypatch.setattr("src.hardware.gpio_manager.os.close", lambda fd: None)
+
+        for mem, expected in ((legacy_mem, False), (bcm2711_mem, True)):
+            monkeypatch.setattr(
+                "src.hardware.gpio_manager.mmap.mmap", lambda fd, size, m=mem: m
+            )
+            assert MMapGPIO()._is_bcm2711 is expected
+
+
+class TestGPIOManagerBatchHelpers:
+    """Behavior of the batched setup/write/read helpers (mock backend)."""
+
+    @pytest.fixture
+    def manager(self):
+        manager = GPIOManager(mock=True)
+        yield manager
+        manager.cleanup()
+
+    def test_setup_output_pins_batch(self, manager):
+        manager.setup_output_pins([18, 19, 20], initial_state=True)
+
+        assert manager.gpio.setup_pins == [18, 19, 20]
+        assert all(manager.gpio.pin_modes[pin] == "OUT" for pin in (18, 19, 20))
+        assert manager.read_pins([18, 19, 20]) == {18: True, 19: True, 20: True}
+
+    def test_setup_input_pins_batch(self, manager):
+        manager.setup_input_pins([21, 22], pull_up=True)
+
+        assert manager.gpio.setup_pins == [21, 22]
+        assert all(manager.gpio.pin_modes[pin] == "IN" for pin in (21, 22))
+
+    def test_set_pins_bulk_round_trip(self, manager):
+        manager.setup_output_pins([18, 19])
+
+        manager.set_pins_bulk([18, 19], True)
+        assert manager.read_pins([18, 19]) == {18: True, 19: True}
+
+        manager.set_pins_bulk([18, 19], False)
+        assert manager.read_pins([18, 19]) == {18: False, 19: False}
+
+    def test_read_pins_matches_single_reads(self, manager):
+        manager.setup_output_pins([18, 19, 26])
+        manager.set_pin(19, True)
+
+        batch = manager.read_pins([18, 19, 26])
+        assert batch == {pin: manager.read_pin(pin) for pin in (18, 19, 26)}
+
+    def test_batch_validates_before_touching_state(self, manager):
+        """One invalid pin rejects the whole batch, leaving no partial
+        state behind."""
+        manager.setup_output_pins([18])
+
+        with pytest.raises(ValueError):
+            manager.setup_output_pins([19, 99])
+        with pytest.raises(ValueError):
+            manager.set_pins_bulk([18, 99], True)
+
+        assert manager.gpio.setup_pins == [18]
+        assert manager.read_pin(18) is False
@@ -0,0 +1,35 @@
+"""
+Shared fixtures for the stability test suite
+Keeps stability tests off the wall clock by virtualizing asyncio.sleep
+"""
+
+import pytest
+
+from src.hardware.gpio_manager import GPIOManager
+from tests.stability.test_suite import FakeClock, virtual_sleep
+
+
+@pytest.fixture(scope="session")
+def mock_gpio():
+    """One mock GPIO manager shared across the stability session.
+
+    Tests call reset_state() to start from a clean slate instead of
+    paying construction and cleanup per test; pass it to
+    StabilityTestSuite(gpio_manager=...) when driving the suite.
+    """
+    gpio = GPIOManager(mock=True)
+    yield gpio
+    gpio.cleanup()
+
+
+@pytest.fixture(autouse=True)
+def fast_asyncio_sleep():
+    """Replace asyncio.sleep with a virtual-clock version for every test.
+
+    Sleeps advance the yielded FakeClock instead of blocking, so tests
+    keep their ordering semantics without real waits. Tests that need
+    to assert on elapsed time can accept this fixture and read the
+    clock directly.
+    """
+    with virtual_sleep(FakeClock()) as clock:
+        yield clock
@@ -3,29 +3,134 @@ Unit tests for the core controller functionality
 """
 
 import asyncio
+from types import MappingProxyType, SimpleNamespace
+
 import pytest
 import pytest_asyncio
-from unittest.mock import Mock, patch, AsyncMock
+from unittest.mock import Mock, patch, AsyncMock, create_autospec
 
-from src.core.controller import HydroponicController
+from src.core.controller import HydroponicController, _load_default_config
 from src.hardware.gpio_manager import GPIOManager
 
 
+# Async tests here run on one loop per module, matching the
+# module-scoped controller fixtures; per-function loops would tear the
+# loop down under fixtures that outlive it
+_module_loop = pytest.mark.asyncio(loop_scope="module")
+
+# Spec introspection walks every GPIOManager attribute; do it once at
+# import and hand tests the same reset instance
+_GPIO_SPEC = create_autospec(GPIOManager, instance=True)
+
+# Shared watering-decision inputs, built once and wrapped read-only so
+# a parametrize rerun can never see a mutated copy
+_READINGS_LOW = MappingProxyType({"moisture_20": 35.0, "moisture_21": 45.0})
+_READINGS_HIGH = MappingProxyType({"moisture_20": 50.0, "moisture_21": 55.0})
+
+
+class StubGPIO:
+    """Hand-rolled GPIO stand-in that records calls into a plain list.
+
+    Skips MagicMock's call machinery entirely: each recorded call is a
+    list append, and assertions are tuple membership checks. Covers
+    just the methods the controller touches in these tests.
+    """
+
+    __slots__ = ("calls", "on_set_pin")
+
+    def __init__(self):
+        self.calls = []
+        # Optional hook fired on set_pin, for event-driven waits
+        self.on_set_pin = None
+
+    def reset(self):
+        self.calls.clear()
+        self.on_set_pin = None
+
+    def set_pin(self, *args, **kwargs):
+        self.calls.append(("set_pin", args, kwargs))
+        if self.on_set_pin is not None:
+            self.on_set_pin(*args, **kwargs)
+
+    def set_pins_bulk(self, *args, **kwargs):
+        self.calls.append(("set_pins_bulk", args, kwargs))
+
+    def read_pin(self, *args, **kwargs):
+        self.calls.append(("read_pin", args, kwargs))
+        return 1  # Inactive for active-low inputs
+
+    def cleanup(self, *args, **kwargs):
+        self.calls.append(("cleanup", args, kwargs))
+
+
+@pytest.fixture(scope="module")
+def _sensor_mocks_built():
+    """Failing/empty sensor mocks built once; AsyncMock setup is not
+    cheap enough to repeat per test."""
+    return SimpleNamespace(
+        moisture=Mock(read_all=AsyncMock(side_effect=Exception("Sensor error"))),
+        overflow=Mock(read_all=AsyncMock(return_value={})),
+    )
+
+
+@pytest.fixture
+def sensor_mocks(_sensor_mocks_built):
+    """Module-built sensor mocks with call history cleared per test."""
+    _sensor_mocks_built.moisture.read_all.reset_mock()
+    _sensor_mocks_built.overflow.read_all.reset_mock()
+    return _sensor_mocks_built
+
+
+@pytest.fixture(scope="module")
+def default_config():
+    """Default configuration shared by read-only assertions.
+
+    Comes straight from the cached module loader; tests that want to
+    mutate it must take a copy.deepcopy first.
+    """
+    return _load_default_config()
+
+
 class TestHydroponicController:
     """Test cases for the main hydroponic controller."""
 
-    @pytest_asyncio.fixture
+    @pytest_asyncio.fixture(scope="module", loop_scope="module")
     async def controller(self):
-        """Create a controller instance for testing."""
-        with patch("src.core.controller.load_dotenv"):
-            controller = HydroponicController()
-            yield controller
-            await controller.stop()
-
-    @pytest_asyncio.fixture
-    async def mock_gpio_manager(self):
-        """Create a mock GPIO manager."""
-        return Mock(spec=GPIOManager)
+        """One controller shared by the class; reset between tests.
+
+        Construction wires GPIO, safety, and sensor managers, so
+        building it per test dominates setup time.
+        """
+        controller = HydroponicController()
+        yield controller
+        await controller.stop()
+
+    @pytest.fixture(autouse=True)
+    def _reset_controller(self, controller):
+        """Roll mutable controller state back around every test."""
+        originals = (
+            controller.gpio_manager,
+            controller.safety_manager,
+            controller.moisture_sensors,
+            controller.overflow_sensors,
+        )
+        controller.running = False
+        controller.emergency_stop = False
+        controller.pump_states.clear()
+        controller.last_sensor_readings = {}
+        yield
+        (
+            controller.gpio_manager,
+            controller.safety_manager,
+            controller.moisture_sensors,
+            controller.overflow_sensors,
+        ) = originals
+
+    @pytest.fixture
+    def mock_gpio_manager(self):
+        """Hand out the cached autospec'd GPIO manager, reset."""
+        _GPIO_SPEC.reset_mock()
+        return _GPIO_SPEC
 
     def test_controller_initialization(self, controller):
         """Test that controller initializes correctly."""
@@ -34,9 +139,9 @@ class TestHydroponicController:
         assert controller.emergency_stop is False
         assert isinstance(controller.pump_states, dict)
 
-    def test_load_default_config(self, controller):
+    def test_load_default_config(self, default_config):
         """Test loading default configuration."""
-        config = controller._get_default_config()
+        config = default_config
 
         assert "pumps" in config
         assert "sensors" in config
@@ -47,7 +152,7 @@ class TestHydroponicController:
         assert config["pumps"]["pins"] == [18, 19, 20, 26]
         assert config["pumps"]["timeout"] == 10.0
 
-    @pytest.mark.asyncio
+    @_module_loop
     async def test_emergency_shutdown(self, controller):
         """Test emergency shutdown functionality."""
         # Start controller
@@ -60,7 +165,7 @@ class TestHydroponicController:
         assert controller.emergency_stop is True
         assert controller.running is False
 
-    @pytest.mark.asyncio
+    @_module_loop
     async def test_pump_safety_checks(self, controller):
         """Test pump safety mechanisms."""
         # Mock safety manager
@@ -70,21 +175,18 @@ class TestHydroponicController:
         # Try to start pump
         result = await controller._start_pump(18, timeout=5.0)
 
-        # Should fail due to safety check
+        # Should fail due to safety check; plain attribute asserts skip
+        # the mock library's call-matching machinery
         assert result is False
-        controller.safety_manager.check_pump_safety.assert_called_once_with(18)
+        assert controller.safety_manager.check_pump_safety.call_count == 1
+        assert controller.safety_manager.check_pump_safety.call_args.args == (18,)
 
-    @pytest.mark.asyncio
-    async def test_sensor_reading_error_handling(self, controller):
+    @_module_loop
+    async def test_sensor_reading_error_handling(self, controller, sensor_mocks):
         """Test error handling in sensor reading."""
-        # Mock sensors to raise exception
-        controller.moisture_sensors = Mock()
-        controller.moisture_sensors.read_all = AsyncMock(
-            side_effect=Exception("Sensor error")
-        )
-
-        controller.overflow_sensors = Mock()
-        controller.overflow_sensors.read_all = AsyncMock(return_value={})
+        # Swap in the prebuilt failing/empty sensor mocks
+        controller.moisture_sensors = sensor_mocks.moisture
+        controller.overflow_sensors = sensor_mocks.overflow
 
         # Should not crash on sensor error
         await controller._read_sensors()
@@ -92,39 +194,57 @@ class TestHydroponicController:
         # Last readings should remain unchanged
         assert isinstance(controller.last_sensor_readings, dict)
 
-    def test_should_water_logic(self, controller):
+    @pytest.mark.parametrize(
+        ("readings", "expected_water"),
+        [
+            # One sensor below the 40% threshold
+            (_READINGS_LOW, True),
+            # All sensors above threshold
+            (_READINGS_HIGH, False),
+        ],
+    )
+    @_module_loop
+    async def test_should_water_logic(self, controller, readings, expected_water):
         """Test watering decision logic."""
-        # Set threshold in config
+        # Set threshold, restoring afterwards since the controller is
+        # shared across the module
+        saved = controller.config["sensors"]["moisture_threshold"]
         controller.config["sensors"]["moisture_threshold"] = 40.0
-
-        # Test case 1: moisture below threshold
-        controller.last_sensor_readings = {
-            "moisture_20": 35.0,  # Below threshold
-            "moisture_21": 45.0,  # Above threshold
-        }
-
-        result = asyncio.run(controller._should_water())
-        assert result is True
-
-        # Test case 2: all moisture above threshold
-        controller.last_sensor_readings = {
-            "moisture_20": 50.0,  # Above threshold
-            "moisture_21": 55.0,  # Above threshold
-        }
-
-        result = asyncio.run(controller._should_water())
-        assert result is False
+        try:
+            controller.last_sensor_readings = readings
+            result = await controller._should_water()
+            assert result is expected_water
+        finally:
+            controller.config["sensors"]["moisture_threshold"] = saved
+
+    def test_last_sensor_readings_partition(self, controller):
+        """Setter partitions by prefix; getter merges both stores."""
+        readings = {"moisture_20": 42.0, "overflow_21": True}
+        controller.last_sensor_readings = readings
+
+        assert controller._moisture_readings == {"moisture_20": 42.0}
+        assert controller._overflow_readings == {"overflow_21": True}
+        assert controller.last_sensor_readings == readings
+
+        # Clearing the readings must also drop the numpy mirror, or the
+        # vectorized watering path keeps seeing the deleted values
+        controller.last_sensor_readings = {}
+        assert controller._moisture_ids == []
+        assert controller._moisture_values is None
 
     def test_get_status(self, controller):
         """Test status reporting."""
         status = controller.get_status()
 
-        assert "running" in status
-        assert "emergency_stop" in status
-        assert "pump_states" in status
-        assert "sensor_readings" in status
-        assert "system_stats" in status
-        assert "uptime" in status
+        # One C-level subset check instead of six membership asserts
+        assert {
+            "running",
+            "emergency_stop",
+            "pump_states",
+            "sensor_readings",
+            "system_stats",
+            "uptime",
+        } <= status.keys()
 
         # Check data types
         assert isinstance(status["running"], bool)
@@ -132,54 +252,56 @@ class TestHydroponicController:
         assert isinstance(status["uptime"], float)
 
 
-class TestControllerConfig:
-    """Test configuration handling."""
-
-    def test_config_loading_with_missing_file(self):
-        """Test behavior when config file is missing."""
-        with patch("src.core.controller.load_dotenv"):
-            controller = HydroponicController(config_path="nonexistent.yaml")
-
-            # Should fall back to defaults
-            assert controller.config is not None
-            assert "pumps" in controller.config
-
-    def test_config_validation(self):
-        """Test configuration validation."""
-        with patch("src.core.controller.load_dotenv"):
-            controller = HydroponicController()
-            config = controller._get_default_config()
+class TestControllerSafety:
+    """Test safety mechanisms."""
 
-            # Validate pump configuration
-            assert len(config["pumps"]["pins"]) > 0
-            assert config["pumps"]["timeout"] > 0
-            assert config["pumps"]["max_daily_runtime"] > 0
+    # Every test in this class is async; mark once
+    pytestmark = _module_loop
 
-            # Validate sensor configuration
-            assert config["sensors"]["moisture_threshold"] >= 0
-            assert config["sensors"]["moisture_threshold"] <= 100
-            assert config["sensors"]["target_moisture"] >= 0
-            assert config["sensors"]["target_moisture"] <= 100
+    @pytest_asyncio.fixture(scope="module", loop_scope="module")
+    async def controller_with_mocks(self):
+        """Controller with mocked dependencies, shared by the class."""
+        controller = HydroponicController()
 
+        async def _mk_gpio():
+            return StubGPIO()
 
-class TestControllerSafety:
-    """Test safety mechanisms."""
+        async def _mk_mock():
+            return Mock()
 
-    @pytest_asyncio.fixture
-    async def controller_with_mocks(self):
-        """Create controller with mocked dependencies."""
-        with patch("src.core.controller.load_dotenv"):
-            controller = HydroponicController()
+        # Build the replacement managers concurrently; these mocks are
+        # instant today, but any future async setup (port open, bus
+        # probe) then overlaps instead of running back-to-back
+        gpio, safety, moisture, overflow = await asyncio.gather(
+            _mk_gpio(), _mk_mock(), _mk_mock(), _mk_mock()
+        )
+        # Plain instance attributes (no property setters involved), so
+        # one dict.update swaps all four managers in a single C call
+        controller.__dict__.update(
+            gpio_manager=gpio,
+            safety_manager=safety,
+            moisture_sensors=moisture,
+            overflow_sensors=overflow,
+        )
 
-            # Mock hardware components
-            controller.gpio_manager = Mock()
-            controller.safety_manager = Mock()
-            controller.moisture_sensors = Mock()
-            controller.overflow_sensors = Mock()
+        yield controller
 
-            yield controller
+    @pytest.fixture(autouse=True)
+    def _reset_mocks(self, controller_with_mocks):
+        """Clear recorded calls and flags around every test."""
+        controller = controller_with_mocks
+        controller.running = False
+        controller.emergency_stop = False
+        controller.pump_states.clear()
+        controller.gpio_manager.reset()
+        controller.safety_manager.reset_mock()
+        controller.moisture_sensors.reset_mock()
+        controller.overflow_sensors.reset_mock()
+        yield
+        # Drop per-test instance overrides (e.g. _check_emergency_stop)
+        # so the next test sees the real methods again
+        controller.__dict__.pop("_check_emergency_stop", None)
 
-    @pytest.mark.asyncio
     async def test_overflow_detection_stops_pumps(self, controller_with_mocks):
         """Test that overflow detection stops all pumps."""
         controller = controller_with_mocks
@@ -191,9 +313,8 @@ class TestControllerSafety:
         await controller._flood_phase()
 
         # Verify pumps were stopped due to overflow
-        controller.overflow_sensors.check_overflow.assert_called()
+        assert controller.overflow_sensors.check_overflow.call_count >= 1
 
-    @pytest.mark.asyncio
     async def test_emergency_stop_handling(self, controller_with_mocks):
         """Test emergency stop button handling."""
         controller = controller_with_mocks
@@ -210,17 +331,24 @@ class TestControllerSafety:
         # Verify emergency state is set
         controller._check_emergency_stop.assert_called()
 
-    @pytest.mark.asyncio
     async def test_pump_timeout_safety(self, controller_with_mocks):
         """Test pump timeout safety mechanism."""
         controller = controller_with_mocks
         controller.safety_manager.check_pump_safety.return_value = True
 
+        # Wake the moment the stub sees the pump driven low, instead of
+        # polling the state dict between loop ticks
+        pump_off = asyncio.Event()
+        controller.gpio_manager.on_set_pin = (
+            lambda pin, state: pump_off.set() if (pin, state) == (18, False) else None
+        )
+
         # Start pump with short timeout
-        await controller._start_pump(18, timeout=0.1)
+        assert await controller._start_pump(18, timeout=0.01) is True
+        assert 18 in controller._pump_deadlines
 
-        # Wait for timeout
-        await asyncio.sleep(0.2)
+        await asyncio.wait_for(pump_off.wait(), timeout=1.0)
 
-        # Pump should be forced off (tested through mock calls)
-        controller.gpio_manager.set_pin.assert_called()
+        # Pump should be forced off
+        assert controller.pump_states.get(18) is False
+        assert ("set_pin", (18, False), {}) in controller.gpio_manager.calls
@@ -0,0 +1,60 @@
+"""
+Unit tests for controller configuration handling
+
+Pure-sync module: no pytest_asyncio import, no event-loop fixtures, so
+collection stays cheap and these tests can run on any xdist worker.
+"""
+
+import pytest
+
+from src.core.controller import HydroponicController, _load_default_config
+
+
+@pytest.fixture(scope="module")
+def default_config():
+    """Default configuration shared by read-only assertions.
+
+    Comes straight from the cached module loader; tests that want to
+    mutate it must take a copy.deepcopy first.
+    """
+    return _load_default_config()
+
+
+class TestControllerConfig:
+    """Test configuration handling."""
+
+    def test_config_loading_with_missing_file(self):
+        """Test behavior when config file is missing."""
+        controller = HydroponicController(config_path="nonexistent.yaml")
+
+        # Should fall back to defaults
+        assert controller.config is not None
+        assert "pumps" in controller.config
+
+    def test_partial_config_merges_defaults(self, tmp_path):
+        """A file with only some sections gets the rest from defaults."""
+        partial = tmp_path / "partial.yaml"
+        partial.write_text("pumps:\n  pins: [5, 6]\n")
+
+        controller = HydroponicController(config_path=str(partial))
+
+        assert controller.config["pumps"]["pins"] == [5, 6]
+        # Sibling keys and untouched sections fall back to defaults
+        assert controller.config["pumps"]["timeout"] == 10.0
+        assert controller.config["safety"]["emergency_pin"] == 25
+        assert controller._emergency_pin == 25
+
+    def test_config_validation(self, default_config):
+        """Test configuration validation."""
+        config = default_config
+
+        # Validate pump configuration
+        assert len(config["pumps"]["pins"]) > 0
+        assert config["pumps"]["timeout"] > 0
+        assert config["pumps"]["max_daily_runtime"] > 0
+
+        # Validate sensor configuration
+        assert config["sensors"]["moisture_threshold"] >= 0
+        assert config["sensors"]["moisture_threshold"] <= 100
+        assert config["sensors"]["target_moisture"] >= 0
+        assert config["sensors"]["target_moisture"] <= 100
@@ -0,0 +1,93 @@
+"""
+Unit tests for moisture sensor calibration persistence
+
+Covers the JSON round trip, transparent migration from the legacy
+YAML file, the mtime-based reload skip, and raw-to-percentage
+conversion against the stored calibration.
+"""
+
+import json
+
+import pytest
+import yaml
+
+from src.sensors.moisture import MoistureSensorManager
+
+
+@pytest.fixture
+def manager(tmp_path, monkeypatch):
+    """Manager rooted in a temp directory so config/ writes stay local."""
+    monkeypatch.chdir(tmp_path)
+    return MoistureSensorManager()
+
+
+class TestCalibrationPersistence:
+    """Calibration file round trip and legacy migration."""
+
+    async def test_json_round_trip(self, manager, tmp_path):
+        """calibrate_sensor persists values a fresh manager reads back."""
+        await manager.calibrate_sensor(0x20, dry_value=520, wet_value=210)
+
+        saved = json.loads((tmp_path / "config/moisture_calibration.json").read_text())
+        assert saved == {"0x20": {"dry": 520, "wet": 210}}
+
+        fresh = MoistureSensorManager()
+        await fresh._load_calibration()
+        assert fresh.calibration_data[0x20] == (520, 210)
+
+    async def test_legacy_yaml_migration(self, manager, tmp_path):
+        """With no JSON file, the old YAML loads and the next save
+        rewrites it as JSON."""
+        legacy = tmp_path / "config"
+        legacy.mkdir()
+        (legacy / "moisture_calibration.yaml").write_text(
+            yaml.safe_dump({"0x21": {"dry": 480, "wet": 190}})
+        )
+
+        await manager._load_calibration()
+        assert manager.calibration_data[0x21] == (480, 190)
+
+        await manager._save_calibration()
+        saved = json.loads((legacy / "moisture_calibration.json").read_text())
+        assert saved == {"0x21": {"dry": 480, "wet": 190}}
+
+    async def test_unchanged_file_not_reloaded(self, manager):
+        """A second load with the same mtime leaves state alone."""
+        await manager.calibrate_sensor(0x20, dry_value=520, wet_value=210)
+        await manager._load_calibration()
+
+        # Locally mutated state survives the skipped reload
+        manager.calibration_data[0x20] = (1, 2)
+        await manager._load_calibration()
+        assert manager.calibration_data[0x20] == (1, 2)
+
+    async def test_missing_files_keep_defaults(self, manager):
+        """No calibration files at all leaves the data empty."""
+        await manager._load_calibration()
+        assert manager.calibration_data == {}
+
+
+class TestPercentageConversion:
+    """Raw capacitance to moisture percentage."""
+
+    def test_calibrated_range(self, manager):
+        manager.calibration_data[0x20] = (500, 200)
+
+        assert manager._convert_to_percentage(0x20, 500) == 0.0
+        assert manager._convert_to_percentage(0x20, 200) == 100.0
+        assert manager._convert_to_percentage(0x20, 350) == 50.0
+
+    def test_clamps_out_of_range(self, manager):
+        manager.calibration_data[0x20] = (500, 200)
+
+        assert manager._convert_to_percentage(0x20, 600) == 0.0
+        assert manager._convert_to_percentage(0x20, 100) == 100.0
+
+    def test_uncalibrated_uses_defaults(self, manager):
+        midpoint = (manager.DEFAULT_DRY + manager.DEFAULT_WET) / 2
+        assert manager._convert_to_percentage(0x23, midpoint) == 50.0
+
+    def test_degenerate_calibration(self, manager):
+        """Equal dry/wet values cannot form a range; pin to 50%."""
+        manager.calibration_data[0x20] = (300, 300)
+        assert manager._convert_to_percentage(0x20, 123) == 50.0
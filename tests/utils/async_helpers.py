@@ -0,0 +1,34 @@
+"""
+Async helpers for OrchidBot tests
+Condition waiting without fixed wall-clock sleeps
+"""
+
+import asyncio
+import time
+from typing import Callable
+
+
+async def wait_for_condition(
+    predicate: Callable[[], bool],
+    timeout: float = 1.0,
+    interval: float = 0.001,
+) -> None:
+    """Wait until predicate() is truthy, yielding between checks.
+
+    Replaces fixed asyncio.sleep(N) waits: latency-to-assertion becomes
+    however long the loop takes to settle instead of the full sleep.
+
+    Args:
+        predicate: Zero-argument callable checked each iteration
+        timeout: Seconds before giving up
+        interval: Pause between checks; 0 degenerates to a pure
+            loop yield
+
+    Raises:
+        TimeoutError: If the condition does not hold within timeout
+    """
+    deadline_ns = time.monotonic_ns() + int(timeout * 1_000_000_000)
+    while not predicate():
+        if time.monotonic_ns() >= deadline_ns:
+            raise TimeoutError(f"Condition not met within {timeout}s")
+        await asyncio.sleep(interval)